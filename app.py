@@ -5,14 +5,18 @@ Connects people with complementary skills to collaborate.
 from fastapi import FastAPI, Depends, HTTPException, status, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session, selectinload, undefer
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 import os
 
 from database import (
-    init_db, get_db, User, Skill, Project, Match, Conversation, Message, Post, PostSlot, HelpRequest, SlotRequest, Comment,
-    user_skills, project_skills
+    init_db, get_db, get_async_db, AsyncSessionLocal, get_skills_cached, profile_version, User, Skill, Project, Match, Conversation, Message, Post, PostImage, PostSlot, HelpRequest, SlotRequest, Comment,
+    user_skills, project_skills, SQL_NOW
 )
 from models import (
     UserCreate, UserLogin, UserUpdate, UserResponse, SkillResponse,
@@ -25,25 +29,52 @@ from models import (
     SlotRequestCreate, SlotRequestResponse, SlotRequestUpdate,
     CommentCreate, CommentResponse
 )
-from matching import find_best_matches
+from matching import (
+    find_best_matches, compute_complementary_match, batch_interest_match, interest_list,
+    get_suggested_matches, refresh_suggestions
+)
+import asyncio
 import hashlib
-import json
-from datetime import datetime
+import orjson
+from operator import attrgetter
+import time
+import traceback
 
 def safe_json_loads(json_str):
-    """Safely parse JSON string, return empty list if invalid."""
+    """Safely parse JSON string, return empty list if invalid. Lists pass through."""
     if not json_str:
         return []
+    if isinstance(json_str, list):
+        return json_str
     try:
-        return json.loads(json_str)
-    except (json.JSONDecodeError, TypeError):
+        return orjson.loads(json_str)
+    except (orjson.JSONDecodeError, TypeError):
         return []
 
+
+# User columns exposed through UserResponse, read in one attrgetter call
+USER_FIELDS = (
+    "id", "email", "username", "full_name", "bio", "profile_picture",
+    "interests", "looking_for", "location", "timezone", "availability",
+    "linkedin_url", "github_url", "profile_type", "created_at"
+)
+get_user_fields = attrgetter(*USER_FIELDS)
+
+
+def user_to_dict(user: User, include_skills: bool = True) -> dict:
+    """Convert a User row to a response dict with parsed JSON fields."""
+    user_dict = dict(zip(USER_FIELDS, get_user_fields(user)))
+    user_dict["interests"] = safe_json_loads(user_dict["interests"])
+    user_dict["looking_for"] = safe_json_loads(user_dict["looking_for"])
+    user_dict["skills"] = [{"id": s.id, "name": s.name, "category": s.category} for s in user.skills] if include_skills else []
+    return user_dict
+
 # Initialize FastAPI app
 app = FastAPI(
     title="CoLab - Collaboration Platform",
     description="Connect with people who have complementary skills",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes large list payloads much faster than stdlib json
 )
 
 # CORS middleware for frontend
@@ -83,12 +114,27 @@ async def startup_event():
         "Project Management", "Agile", "Scrum"
     ]
     for skill_name in default_skills:
-        existing = db.query(Skill).filter(Skill.name == skill_name).first()
+        existing = db.query(db.query(Skill).filter(Skill.name == skill_name).exists()).scalar()
         if not existing:
             skill = Skill(name=skill_name, category="programming" if skill_name in ["Python", "JavaScript", "React"] else "other")
             db.add(skill)
     db.commit()
     db.close()
+    # Keep a reference so the running task is not garbage collected
+    app.state.suggestions_task = asyncio.create_task(refresh_suggestions_periodically())
+
+
+SUGGESTIONS_REFRESH_SECONDS = 60
+
+
+async def refresh_suggestions_periodically():
+    """Rebuild suggested_matches whenever they are stale, checking every SUGGESTIONS_REFRESH_SECONDS."""
+    while True:
+        try:
+            await asyncio.to_thread(refresh_suggestions)
+        except Exception:
+            print(traceback.format_exc())
+        await asyncio.sleep(SUGGESTIONS_REFRESH_SECONDS)
 
 
 # Serve static files (frontend)
@@ -138,11 +184,11 @@ async def aimatch_page():
 def create_user(user: UserCreate, db: Session = Depends(get_db)):
     """Create a new user account."""
     # Check if email or username already exists
-    existing_email = db.query(User).filter(User.email == user.email).first()
+    existing_email = db.query(db.query(User).filter(User.email == user.email).exists()).scalar()
     if existing_email:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    existing_username = db.query(User).filter(User.username == user.username).first()
+    existing_username = db.query(db.query(User).filter(User.username == user.username).exists()).scalar()
     if existing_username:
         raise HTTPException(status_code=400, detail="Username already taken")
     
@@ -176,138 +222,83 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     db.refresh(db_user)
     
     # Return user with parsed JSON fields
-    user_dict = {
-        "id": db_user.id,
-        "email": db_user.email,
-        "username": db_user.username,
-        "full_name": db_user.full_name,
-        "bio": db_user.bio,
-        "profile_picture": db_user.profile_picture,
-        "interests": safe_json_loads(db_user.interests),
-        "looking_for": safe_json_loads(db_user.looking_for),
-        "location": db_user.location,
-        "timezone": db_user.timezone,
-        "availability": db_user.availability,
-        "linkedin_url": db_user.linkedin_url,
-        "github_url": db_user.github_url,
-        "profile_type": db_user.profile_type,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in db_user.skills],
-        "created_at": db_user.created_at
-    }
-    return user_dict
+    return user_to_dict(db_user)
+
+
+USERS_ADAPTER = TypeAdapter(List[UserResponse])
 
 
 @app.get("/api/users", response_model=List[UserResponse])
-def get_users(
+async def get_users(
     skip: int = 0, 
     limit: int = 100, 
     current_user_id: Optional[int] = Query(None, description="ID of logged-in user to calculate match percentages"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all users. If current_user_id is provided, includes interest match percentages."""
-    from matching import get_interest_match_for_user
-    
-    users = db.query(User).filter(User.is_active == True).offset(skip).limit(limit).all()
+    users = (await db.execute(select(User).where(User.is_active == True).offset(skip).limit(limit))).scalars().all()
     
     # Get current user if provided
     current_user = None
     if current_user_id:
-        current_user = db.query(User).filter(User.id == current_user_id).first()
+        current_user = await db.get(User, current_user_id)
     
-    # Parse JSON fields for each user
+    # Calculate interest matches for the whole page at once if current user is provided;
+    # the scoring is CPU-bound and locks the candidate columns, so keep it off the event loop
+    similarities = None
+    if current_user:
+        similarities = (await run_in_threadpool(batch_interest_match, current_user, users)).tolist()
+    
+    # Rows come straight from the database, so build responses without re-validating them
     result = []
-    for user in users:
-        user_dict = {
-            "id": user.id,
-            "email": user.email,
-            "username": user.username,
-            "full_name": user.full_name,
-            "bio": user.bio,
-            "profile_picture": user.profile_picture,
-            "interests": safe_json_loads(user.interests),
-            "looking_for": safe_json_loads(user.looking_for),
-            "location": user.location,
-            "timezone": user.timezone,
-            "availability": user.availability,
-            "linkedin_url": user.linkedin_url,
-            "github_url": user.github_url,
-            "profile_type": user.profile_type,
-            "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in user.skills],
-            "created_at": user.created_at
-        }
-        
-        # Calculate interest match if current user is provided and it's not the same user
+    for index, user in enumerate(users):
+        # No match percentage for the current user themselves
+        match_percentage = None
         if current_user and current_user.id != user.id:
-            match_percentage = get_interest_match_for_user(current_user, user)
-            user_dict["interest_match"] = match_percentage
+            match_percentage = round(similarities[index], 4)
         
-        result.append(user_dict)
+        result.append(UserResponse.from_orm_fast(user, interest_match=match_percentage))
     
-    return result
+    return Response(content=USERS_ADAPTER.dump_json(result), media_type="application/json")
 
 
 @app.post("/api/auth/login", response_model=UserResponse)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
     """Login user."""
     password_hash = hashlib.sha256(credentials.password.encode()).hexdigest()
-    user = db.query(User).filter(
+    user = (await db.execute(select(User).where(
         User.username == credentials.username,
         User.password == password_hash,
         User.is_active == True
-    ).first()
+    ))).scalars().first()
     
     if not user:
         raise HTTPException(status_code=401, detail="Invalid username or password")
     
     # Parse JSON fields
-    user_dict = {
-        "id": user.id,
-        "email": user.email,
-        "username": user.username,
-        "full_name": user.full_name,
-        "bio": user.bio,
-        "profile_picture": user.profile_picture,
-        "interests": safe_json_loads(user.interests),
-        "looking_for": safe_json_loads(user.looking_for),
-        "location": user.location,
-        "timezone": user.timezone,
-        "availability": user.availability,
-        "linkedin_url": user.linkedin_url,
-        "github_url": user.github_url,
-        "profile_type": user.profile_type,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in user.skills],
-        "created_at": user.created_at
-    }
-    return user_dict
+    return user_to_dict(user)
+
+
+# Serialized profiles by user id, stored with the profile_version() they were built at
+_profile_cards = {}
 
 
 @app.get("/api/users/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific user by ID. Public endpoint - accessible to everyone."""
-    user = db.query(User).filter(User.id == user_id, User.is_active == True).first()
+    version = profile_version(user_id)
+    cached = _profile_cards.get(user_id)
+    if cached and cached[0] == version:
+        return cached[1]
+    
+    user = (await db.execute(select(User).where(User.id == user_id, User.is_active == True))).scalars().first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Parse JSON fields
-    user_dict = {
-        "id": user.id,
-        "email": user.email,
-        "username": user.username,
-        "full_name": user.full_name,
-        "bio": user.bio,
-        "profile_picture": user.profile_picture,
-        "interests": safe_json_loads(user.interests),
-        "looking_for": safe_json_loads(user.looking_for),
-        "location": user.location,
-        "timezone": user.timezone,
-        "availability": user.availability,
-        "linkedin_url": user.linkedin_url,
-        "github_url": user.github_url,
-        "profile_type": user.profile_type,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in user.skills],
-        "created_at": user.created_at
-    }
-    return user_dict
+    card = user_to_dict(user)
+    _profile_cards[user_id] = (version, card)
+    return card
 
 
 @app.put("/api/users/{user_id}", response_model=UserResponse)
@@ -325,9 +316,9 @@ def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get
     if user_update.profile_picture is not None:
         user.profile_picture = user_update.profile_picture
     if user_update.interests is not None:
-        user.interests = json.dumps(user_update.interests)
+        user.interests = user_update.interests
     if user_update.looking_for is not None:
-        user.looking_for = json.dumps(user_update.looking_for)
+        user.looking_for = user_update.looking_for
     if user_update.location is not None:
         user.location = user_update.location
     if user_update.timezone is not None:
@@ -353,34 +344,19 @@ def update_user(user_id: int, user_update: UserUpdate, db: Session = Depends(get
             user.skills.append(skill)
     
     db.commit()
+    invalidate_feed_cache()
     db.refresh(user)
     
     # Return user with parsed JSON fields
-    user_dict = {
-        "id": user.id,
-        "email": user.email,
-        "username": user.username,
-        "full_name": user.full_name,
-        "bio": user.bio,
-        "profile_picture": user.profile_picture,
-        "interests": safe_json_loads(user.interests),
-        "looking_for": safe_json_loads(user.looking_for),
-        "location": user.location,
-        "timezone": user.timezone,
-        "availability": user.availability,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in user.skills],
-        "created_at": user.created_at
-    }
-    return user_dict
+    return user_to_dict(user)
 
 
 # ========== Skill Endpoints ==========
 
 @app.get("/api/skills", response_model=List[SkillResponse])
-def get_skills(db: Session = Depends(get_db)):
+def get_skills():
     """Get all available skills."""
-    skills = db.query(Skill).all()
-    return skills
+    return [{"id": skill_id, "name": name, "category": category} for skill_id, name, category in get_skills_cached()]
 
 
 # ========== Project Endpoints ==========
@@ -415,16 +391,16 @@ def create_project(project: ProjectCreate, owner_id: int = Query(..., descriptio
 
 
 @app.get("/api/projects", response_model=List[ProjectResponse])
-def get_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def get_projects(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_async_db)):
     """Get all projects."""
-    projects = db.query(Project).offset(skip).limit(limit).all()
+    projects = (await db.execute(select(Project).offset(skip).limit(limit))).scalars().all()
     return projects
 
 
 @app.get("/api/projects/{project_id}", response_model=ProjectResponse)
-def get_project(project_id: int, db: Session = Depends(get_db)):
+async def get_project(project_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific project."""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = await db.get(Project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -446,51 +422,39 @@ def find_matches(match_request: MatchRequest, db: Session = Depends(get_db)):
         if project:
             required_skills = [s.name for s in project.required_skills]
     
-    # Get all active users
-    all_users = db.query(User).filter(User.is_active == True).all()
+    # Plain matches are precomputed; only required skills need a live scan
+    matches = None if required_skills else get_suggested_matches(db, requester, match_request.top_k)
     
-    # Find matches
-    matches = find_best_matches(
-        requester=requester,
-        all_users=all_users,
-        required_skills=required_skills,
-        top_k=match_request.top_k
-    )
+    if matches is None:
+        # Get all other active users
+        all_users = db.query(User).filter(User.is_active == True, User.id != requester.id).all()
+        
+        # Find matches
+        matches = find_best_matches(
+            requester=requester,
+            all_users=all_users,
+            required_skills=required_skills,
+            top_k=match_request.top_k
+        )
     
     # Format response
-    from matching import get_interest_match_for_user
     match_details = []
-    for candidate, score, details in matches:
-        # Calculate interest match
-        interest_match = get_interest_match_for_user(requester, candidate)
+    interest_matches = batch_interest_match(requester, [candidate for candidate, _, _ in matches]).tolist()
+    for (candidate, score, details), similarity in zip(matches, interest_matches):
+        interest_match = round(similarity, 4)
+        reasons = details.as_dict()
         
-        # Convert ORM object to dict with parsed JSON fields
-        candidate_dict = {
-            "id": candidate.id,
-            "email": candidate.email,
-            "username": candidate.username,
-            "full_name": candidate.full_name,
-            "bio": candidate.bio,
-            "profile_picture": candidate.profile_picture,
-            "interests": safe_json_loads(candidate.interests),
-            "looking_for": safe_json_loads(candidate.looking_for),
-            "location": candidate.location,
-            "timezone": candidate.timezone,
-            "availability": candidate.availability,
-            "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in candidate.skills],
-            "interest_match": interest_match,  # Add interest match percentage
-            "created_at": candidate.created_at
-        }
         match_details.append(MatchDetail(
-            matched_user=UserResponse.model_validate(candidate_dict),
+            matched_user=UserResponse.from_orm_fast(candidate, interest_match=interest_match),
             match_score=score,
-            complementary_skills=details.get("complementary_skills", []),
-            shared_skills=details.get("shared_skills", []),
-            missing_skills=details.get("missing_skills", []),
-            match_reasons=details
+            complementary_skills=reasons["complementary_skills"],
+            shared_skills=reasons["shared_skills"],
+            missing_skills=reasons["missing_skills"],
+            match_reasons=reasons
         ))
     
-    return MatchResponse(matches=match_details, total_found=len(match_details))
+    response = MatchResponse(matches=match_details, total_found=len(match_details))
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 def generate_teaming_suggestion(match_percentage: float, user_skills: List[str], candidate_skills: List[str]) -> str:
@@ -540,36 +504,17 @@ def get_ai_match(user_id: int, db: Session = Depends(get_db)):
     if not all_users:
         raise HTTPException(status_code=404, detail="No other users available for matching")
 
-    # Find the best interest match
-    best_match = None
-    best_score = -1
-    best_details = None
-
-    from matching import get_interest_match_for_user
-
-    for candidate in all_users:
-        # Skip if no interests
-        user_interests = safe_json_loads(user.interests)
-        candidate_interests = safe_json_loads(candidate.interests)
-
-        if not user_interests or not candidate_interests:
-            continue
-
-        # Calculate interest match
-        interest_score = get_interest_match_for_user(user, candidate)
-
-        if interest_score > best_score:
-            best_score = interest_score
-            best_match = candidate
-            best_details = {
-                "interest_match": interest_score,
-                "user_interests": user_interests,
-                "candidate_interests": candidate_interests
-            }
-
-    if not best_match:
+    # Skip candidates without interests
+    candidates = [candidate for candidate in all_users if interest_list(candidate)] if interest_list(user) else []
+    if not candidates:
         raise HTTPException(status_code=404, detail="No suitable interest-based matches found")
 
+    # Find the best interest match; max keeps the first of equal scores
+    scores = [round(similarity, 4) for similarity in batch_interest_match(user, candidates).tolist()]
+    best_index = max(range(len(scores)), key=scores.__getitem__)
+    best_match = candidates[best_index]
+    best_score = scores[best_index]
+
     # Get candidate skills
     candidate_skills = [s.name for s in best_match.skills]
 
@@ -582,22 +527,7 @@ def get_ai_match(user_id: int, db: Session = Depends(get_db)):
 
     # Format response
     candidate_dict = {
-        "id": best_match.id,
-        "email": best_match.email,
-        "username": best_match.username,
-        "full_name": best_match.full_name,
-        "bio": best_match.bio,
-        "profile_picture": best_match.profile_picture,
-        "interests": safe_json_loads(best_match.interests),
-        "looking_for": safe_json_loads(best_match.looking_for),
-        "location": best_match.location,
-        "timezone": best_match.timezone,
-        "availability": best_match.availability,
-        "linkedin_url": best_match.linkedin_url,
-        "github_url": best_match.github_url,
-        "profile_type": best_match.profile_type,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in best_match.skills],
-        "created_at": best_match.created_at,
+        **user_to_dict(best_match),
         "interest_match": best_score,
         "teaming_suggestion": suggestion
     }
@@ -617,7 +547,6 @@ def create_connection(connection: ConnectionRequest, db: Session = Depends(get_d
         raise HTTPException(status_code=404, detail="User not found")
     
     # Calculate match score
-    from matching import compute_complementary_match
     score, _ = compute_complementary_match(requester, matched_user)
     
     # Create match record
@@ -635,11 +564,11 @@ def create_connection(connection: ConnectionRequest, db: Session = Depends(get_d
 
 
 @app.get("/api/connections/{user_id}", response_model=List[ConnectionResponse])
-def get_connections(user_id: int, db: Session = Depends(get_db)):
+async def get_connections(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get all connections for a user."""
-    connections = db.query(Match).filter(
+    connections = (await db.execute(select(Match).where(
         (Match.requester_id == user_id) | (Match.matched_user_id == user_id)
-    ).all()
+    ))).scalars().all()
     return connections
 
 
@@ -651,6 +580,24 @@ PRE_WRITTEN_MESSAGES = [
     "Hey there! I think we could work well together. Want to discuss potential collaboration?"
 ]
 
+def conversation_between(user_a: int, user_b: int):
+    """Select the conversation between two users (user1_id is always the lower ID)."""
+    return select(Conversation).where(
+        Conversation.user1_id == min(user_a, user_b),
+        Conversation.user2_id == max(user_a, user_b)
+    )
+
+
+# Built once so every message write reuses the same compiled statement
+# instead of going through an ORM flush.
+_MESSAGE_INSERT = Message.__table__.insert().returning(*Message.__table__.c)
+
+
+def insert_message(db: Session, **values):
+    """Insert a message row in the current transaction and return it."""
+    return db.execute(_MESSAGE_INSERT, values).one()
+
+
 @app.get("/api/messages/pre-written")
 def get_pre_written_messages():
     """Get the 3 pre-written hello messages."""
@@ -670,10 +617,7 @@ def create_conversation(conversation: ConversationCreate, sender_id: int = Query
         raise HTTPException(status_code=400, detail="Cannot message yourself")
     
     # Check if conversation already exists
-    existing = db.query(Conversation).filter(
-        ((Conversation.user1_id == sender_id) & (Conversation.user2_id == conversation.other_user_id)) |
-        ((Conversation.user1_id == conversation.other_user_id) & (Conversation.user2_id == sender_id))
-    ).first()
+    existing = db.execute(select(conversation_between(sender_id, conversation.other_user_id).exists())).scalar()
     
     if existing:
         raise HTTPException(status_code=400, detail="Conversation already exists")
@@ -687,35 +631,18 @@ def create_conversation(conversation: ConversationCreate, sender_id: int = Query
     db.flush()
     
     # Create initial message
-    db_message = Message(
+    db_message = insert_message(
+        db,
         conversation_id=db_conversation.id,
         sender_id=sender_id,
         content=conversation.initial_message,
         is_initial_greeting=True
     )
-    db.add(db_message)
     db.commit()
     db.refresh(db_conversation)
     
     # Get other user info
-    other_user_dict = {
-        "id": other_user.id,
-        "email": other_user.email,
-        "username": other_user.username,
-        "full_name": other_user.full_name,
-        "bio": other_user.bio,
-        "profile_picture": other_user.profile_picture,
-        "interests": safe_json_loads(other_user.interests),
-        "looking_for": safe_json_loads(other_user.looking_for),
-        "location": other_user.location,
-        "timezone": other_user.timezone,
-        "availability": other_user.availability,
-        "linkedin_url": other_user.linkedin_url,
-        "github_url": other_user.github_url,
-        "profile_type": other_user.profile_type,
-        "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in other_user.skills],
-        "created_at": other_user.created_at
-    }
+    other_user_dict = user_to_dict(other_user)
     
     return {
         "id": db_conversation.id,
@@ -738,87 +665,66 @@ def create_conversation(conversation: ConversationCreate, sender_id: int = Query
 
 
 @app.get("/api/conversations/{user_id}", response_model=List[ConversationResponse])
-def get_conversations(user_id: int, db: Session = Depends(get_db)):
+async def get_conversations(user_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get all conversations for a user."""
-    conversations = db.query(Conversation).filter(
-        (Conversation.user1_id == user_id) | (Conversation.user2_id == user_id)
-    ).order_by(Conversation.updated_at.desc()).all()
+    conversations = (await db.execute(Conversation.inbox_query(user_id))).mappings().all()
+    
+    # Load every other participant (with skills) in one query
+    other_ids = {conv["user2_id"] if conv["user1_id"] == user_id else conv["user1_id"] for conv in conversations}
+    other_users = {
+        user.id: user_to_dict(user)
+        for user in (await db.execute(
+            select(User).where(User.id.in_(other_ids)).options(selectinload(User.skills))
+        )).scalars()
+    }
     
     result = []
     for conv in conversations:
-        other_user_id = conv.user2_id if conv.user1_id == user_id else conv.user1_id
-        other_user = db.query(User).filter(User.id == other_user_id).first()
-        
-        # Get last message
-        last_message = db.query(Message).filter(Message.conversation_id == conv.id).order_by(Message.created_at.desc()).first()
-        
-        # Count unread messages
-        unread_count = db.query(Message).filter(
-            Message.conversation_id == conv.id,
-            Message.sender_id != user_id,
-            Message.read == False
-        ).count()
-        
-        other_user_dict = {
-            "id": other_user.id,
-            "email": other_user.email,
-            "username": other_user.username,
-            "full_name": other_user.full_name,
-            "bio": other_user.bio,
-            "profile_picture": other_user.profile_picture,
-            "interests": safe_json_loads(other_user.interests),
-            "looking_for": safe_json_loads(other_user.looking_for),
-            "location": other_user.location,
-            "timezone": other_user.timezone,
-            "availability": other_user.availability,
-            "linkedin_url": other_user.linkedin_url,
-            "github_url": other_user.github_url,
-            "profile_type": other_user.profile_type,
-            "skills": [{"id": s.id, "name": s.name, "category": s.category} for s in other_user.skills],
-            "created_at": other_user.created_at
-        }
+        other_user_id = conv["user2_id"] if conv["user1_id"] == user_id else conv["user1_id"]
         
         result.append({
-            "id": conv.id,
-            "user1_id": conv.user1_id,
-            "user2_id": conv.user2_id,
-            "created_at": conv.created_at,
-            "updated_at": conv.updated_at,
-            "other_user": other_user_dict,
+            "id": conv["id"],
+            "user1_id": conv["user1_id"],
+            "user2_id": conv["user2_id"],
+            "created_at": conv["created_at"],
+            "updated_at": conv["updated_at"],
+            "other_user": other_users.get(other_user_id),
             "last_message": {
-                "id": last_message.id,
-                "conversation_id": last_message.conversation_id,
-                "sender_id": last_message.sender_id,
-                "content": last_message.content,
-                "is_initial_greeting": last_message.is_initial_greeting,
-                "read": last_message.read,
-                "created_at": last_message.created_at
-            } if last_message else None,
-            "unread_count": unread_count
+                "id": conv["last_id"],
+                "conversation_id": conv["last_conversation_id"],
+                "sender_id": conv["last_sender_id"],
+                "content": conv["last_content"],
+                "is_initial_greeting": conv["last_is_initial_greeting"],
+                "read": conv["last_read"],
+                "created_at": conv["last_created_at"]
+            } if conv["last_id"] is not None else None,
+            "unread_count": conv["unread_count"]
         })
     
     return result
 
 
 @app.get("/api/conversations/{conversation_id}/messages", response_model=List[MessageResponse])
-def get_messages(conversation_id: int, user_id: int = Query(..., description="ID of the user requesting messages"), db: Session = Depends(get_db)):
+async def get_messages(conversation_id: int, user_id: int = Query(..., description="ID of the user requesting messages"), db: AsyncSession = Depends(get_async_db)):
     """Get all messages in a conversation."""
-    conversation = db.query(Conversation).filter(Conversation.id == conversation_id).first()
+    conversation = await db.get(Conversation, conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
     if conversation.user1_id != user_id and conversation.user2_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to view this conversation")
     
-    messages = db.query(Message).filter(Message.conversation_id == conversation_id).order_by(Message.created_at.asc()).all()
+    messages = (await db.execute(
+        select(Message).where(Message.conversation_id == conversation_id).order_by(Message.created_at.asc())
+    )).scalars().all()
     
     # Mark messages as read
-    db.query(Message).filter(
+    await db.execute(update(Message).where(
         Message.conversation_id == conversation_id,
         Message.sender_id != user_id,
         Message.read == False
-    ).update({"read": True})
-    db.commit()
+    ).values(read=True))
+    await db.commit()
     
     return messages
 
@@ -841,25 +747,42 @@ def send_message(conversation_id: int, message: MessageCreate, sender_id: int =
         if first_message.is_initial_greeting and first_message.sender_id == sender_id:
             raise HTTPException(status_code=400, detail="Please wait for the other user to reply to your initial message")
     
-    db_message = Message(
+    db_message = insert_message(
+        db,
         conversation_id=conversation_id,
         sender_id=sender_id,
         content=message.content,
         is_initial_greeting=message.is_initial_greeting
     )
-    db.add(db_message)
     
     # Update conversation timestamp
-    from datetime import datetime
-    conversation.updated_at = datetime.utcnow()
+    conversation.updated_at = SQL_NOW
     
     db.commit()
-    db.refresh(db_message)
     return db_message
 
 
 # ========== Post Endpoints ==========
 
+# Short-lived cache of the serialized landing-feed page. Only the first page at
+# the default size is cached: it is the most requested read and the same for
+# every user, and other sizes would each add an entry.
+FEED_CACHE_TTL = 20  # seconds
+FEED_PAGE_SIZE = 50
+_feed_cache = {}
+
+
+def invalidate_feed_cache():
+    """Drop cached feed pages after a write that changes what the feed shows."""
+    _feed_cache.clear()
+
+
+# Built once at import; get_posts returns pre-serialized bytes, so these are
+# the only validation pass feed responses go through.
+POST_ADAPTER = TypeAdapter(PostResponse)
+POSTS_ADAPTER = TypeAdapter(List[PostResponse])
+
+
 @app.post("/api/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 def create_post(post: PostCreate, author_id: int = Query(..., description="ID of the user creating the post"), db: Session = Depends(get_db)):
     """Create a new post."""
@@ -870,12 +793,13 @@ def create_post(post: PostCreate, author_id: int = Query(..., description="ID of
     db_post = Post(
         author_id=author_id,
         content=post.content,
-        image=post.image,
+        image=PostImage(image=post.image) if post.image else None,
         slot_count=post.slot_count,
         post_type=post.post_type or 'regular'
     )
     db.add(db_post)
     db.commit()
+    invalidate_feed_cache()
     db.refresh(db_post)
     
     # Build response with author info
@@ -883,7 +807,7 @@ def create_post(post: PostCreate, author_id: int = Query(..., description="ID of
             "id": db_post.id,
             "author_id": db_post.author_id,
             "content": db_post.content,
-            "image": db_post.image,
+            "image": post.image,
             "slot_count": db_post.slot_count,
             "post_type": db_post.post_type or 'regular',
             "filled_slots": 0,
@@ -893,147 +817,107 @@ def create_post(post: PostCreate, author_id: int = Query(..., description="ID of
         }
     
     # Add author info
-    author_dict = {
-        "id": author.id,
-        "email": author.email,
-        "username": author.username,
-        "full_name": author.full_name,
-        "bio": author.bio,
-        "profile_picture": author.profile_picture,
-        "interests": safe_json_loads(author.interests) if author.interests else [],
-        "looking_for": safe_json_loads(author.looking_for) if author.looking_for else [],
-        "location": author.location,
-        "timezone": author.timezone,
-        "availability": author.availability,
-        "linkedin_url": author.linkedin_url,
-        "github_url": author.github_url,
-        "profile_type": author.profile_type,
-        "created_at": author.created_at,
-        "is_active": author.is_active
-    }
+    author_dict = user_to_dict(author, include_skills=False)
     post_dict["author"] = author_dict
     
     return post_dict
 
 
-@app.get("/api/posts", response_model=List[PostResponse])
-def get_posts(skip: int = 0, limit: int = 50, db: Session = Depends(get_db)):
-    """Get all posts."""
-    posts = db.query(Post).order_by(Post.created_at.desc()).offset(skip).limit(limit).all()
+def feed_query(skip: int, limit: int):
+    """Select a page of posts with everything the feed renders eagerly loaded."""
+    return (
+        select(Post)
+        .options(
+            selectinload(Post.author).lazyload(User.skills),
+            selectinload(Post.slots).selectinload(PostSlot.user).lazyload(User.skills),
+            selectinload(Post.help_requests),
+            selectinload(Post.image),
+            undefer(Post.comment_count)
+        )
+        .order_by(Post.created_at.desc())
+        .offset(skip)
+        .limit(limit)
+    )
+
+
+def post_to_dict(post: Post) -> dict:
+    """Convert a feed Post row (with loaded relationships) to a response dict."""
+    author = post.author
+    slots = post.slots
+    help_requests = post.help_requests
     
-    result = []
-    for post in posts:
-        author = db.query(User).filter(User.id == post.author_id).first()
-        slots = db.query(PostSlot).filter(PostSlot.post_id == post.id).all()
-        help_requests = db.query(HelpRequest).filter(HelpRequest.post_id == post.id).all()
-        comments = db.query(Comment).filter(Comment.post_id == post.id).order_by(Comment.created_at.asc()).all()
-        
-        post_dict = {
-            "id": post.id,
-            "author_id": post.author_id,
-            "content": post.content,
-            "image": post.image,
-            "slot_count": post.slot_count,
-            "post_type": post.post_type or 'regular',
-            "filled_slots": len(slots),
-            "slots": [],
-            "help_request_count": len(help_requests),
-            "comments": [],
-            "created_at": post.created_at
+    post_dict = {
+        "id": post.id,
+        "author_id": post.author_id,
+        "content": post.content,
+        "image": post.image.image if post.image else None,
+        "slot_count": post.slot_count,
+        "post_type": post.post_type or 'regular',
+        "filled_slots": len(slots),
+        "slots": [],
+        "help_request_count": len(help_requests),
+        "comment_count": post.comment_count,
+        "created_at": post.created_at
+    }
+    
+    # Add author info
+    if author:
+        author_dict = user_to_dict(author, include_skills=False)
+        post_dict["author"] = author_dict
+    
+    # Add slot info
+    slot_list = []
+    for slot in slots:
+        slot_user = slot.user
+        slot_dict = {
+            "id": slot.id,
+            "user_id": slot.user_id,
+            "created_at": slot.created_at
         }
-        
-        # Add author info
-        if author:
-            author_dict = {
-                "id": author.id,
-                "email": author.email,
-                "username": author.username,
-                "full_name": author.full_name,
-                "bio": author.bio,
-                "profile_picture": author.profile_picture,
-                "interests": safe_json_loads(author.interests) if author.interests else [],
-                "looking_for": safe_json_loads(author.looking_for) if author.looking_for else [],
-                "location": author.location,
-                "timezone": author.timezone,
-                "availability": author.availability,
-                "linkedin_url": author.linkedin_url,
-                "github_url": author.github_url,
-                "profile_type": author.profile_type,
-                "created_at": author.created_at,
-                "is_active": author.is_active
-            }
-            post_dict["author"] = author_dict
-        
-        # Add slot info
-        slot_list = []
-        for slot in slots:
-            slot_user = db.query(User).filter(User.id == slot.user_id).first()
-            slot_dict = {
-                "id": slot.id,
-                "user_id": slot.user_id,
-                "created_at": slot.created_at
-            }
-            if slot_user:
-                slot_user_dict = {
-                    "id": slot_user.id,
-                    "email": slot_user.email,
-                    "username": slot_user.username,
-                    "full_name": slot_user.full_name,
-                    "bio": slot_user.bio,
-                    "profile_picture": slot_user.profile_picture,
-                    "interests": safe_json_loads(slot_user.interests) if slot_user.interests else [],
-                    "looking_for": safe_json_loads(slot_user.looking_for) if slot_user.looking_for else [],
-                    "location": slot_user.location,
-                    "timezone": slot_user.timezone,
-                    "availability": slot_user.availability,
-                    "linkedin_url": slot_user.linkedin_url,
-                    "github_url": slot_user.github_url,
-                    "profile_type": slot_user.profile_type,
-                    "created_at": slot_user.created_at,
-                    "is_active": slot_user.is_active
-                }
-                slot_dict["user"] = slot_user_dict
-            slot_list.append(slot_dict)
-        post_dict["slots"] = slot_list
-        
-        # Add comments
-        comment_list = []
-        for comment in comments:
-            comment_author = db.query(User).filter(User.id == comment.author_id).first()
-            comment_dict = {
-                "id": comment.id,
-                "post_id": comment.post_id,
-                "author_id": comment.author_id,
-                "content": comment.content,
-                "created_at": comment.created_at
-            }
-            if comment_author:
-                comment_author_dict = {
-                    "id": comment_author.id,
-                    "email": comment_author.email,
-                    "username": comment_author.username,
-                    "full_name": comment_author.full_name,
-                    "bio": comment_author.bio,
-                    "profile_picture": comment_author.profile_picture,
-                    "interests": safe_json_loads(comment_author.interests) if comment_author.interests else [],
-                    "looking_for": safe_json_loads(comment_author.looking_for) if comment_author.looking_for else [],
-                    "location": comment_author.location,
-                    "timezone": comment_author.timezone,
-                    "availability": comment_author.availability,
-                    "linkedin_url": comment_author.linkedin_url,
-                    "github_url": comment_author.github_url,
-                    "profile_type": comment_author.profile_type,
-                    "created_at": comment_author.created_at,
-                    "is_active": comment_author.is_active,
-                    "skills": []
-                }
-                comment_dict["author"] = comment_author_dict
-            comment_list.append(comment_dict)
-        post_dict["comments"] = comment_list
-        
-        result.append(post_dict)
+        if slot_user:
+            slot_user_dict = user_to_dict(slot_user, include_skills=False)
+            slot_dict["user"] = slot_user_dict
+        slot_list.append(slot_dict)
+    post_dict["slots"] = slot_list
     
-    return result
+    return post_dict
+
+
+async def stream_posts(skip: int, limit: int):
+    """Yield feed posts as NDJSON lines, reading rows from a server-side cursor."""
+    # The request-scoped session is closed before a streaming body is sent,
+    # so the generator owns its session.
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(feed_query(skip, limit).execution_options(yield_per=20))
+        async for post in result.scalars():
+            yield POST_ADAPTER.dump_json(POST_ADAPTER.validate_python(post_to_dict(post))) + b"\n"
+
+
+@app.get("/api/posts", response_model=List[PostResponse])
+async def get_posts(
+    skip: int = 0,
+    limit: int = FEED_PAGE_SIZE,
+    stream: bool = Query(False, description="Stream posts as newline-delimited JSON"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get all posts. The first page is served from a short-lived cache."""
+    if stream:
+        return StreamingResponse(stream_posts(skip, limit), media_type="application/x-ndjson")
+
+    cache_key = (skip, limit)
+    cacheable = skip == 0 and limit == FEED_PAGE_SIZE
+    if cacheable:
+        cached = _feed_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return Response(content=cached[1], media_type="application/json")
+
+    posts = (await db.execute(feed_query(skip, limit))).scalars().all()
+    result = [post_to_dict(post) for post in posts]
+    
+    body = POSTS_ADAPTER.dump_json(POSTS_ADAPTER.validate_python(result))
+    if cacheable:
+        _feed_cache[cache_key] = (time.monotonic() + FEED_CACHE_TTL, body)
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/posts/{post_id}/request-slot", response_model=SlotRequestResponse)
@@ -1053,19 +937,23 @@ def request_slot(post_id: int, request: SlotRequestCreate, db: Session = Depends
         raise HTTPException(status_code=400, detail="You cannot request a slot in your own post")
 
     # Check if user already has a pending or accepted request
-    existing_request = db.query(SlotRequest).filter(
-        SlotRequest.post_id == post_id,
-        SlotRequest.requester_user_id == request.user_id,
-        SlotRequest.status.in_(["pending", "accepted"])
-    ).first()
+    existing_request = db.query(
+        db.query(SlotRequest).filter(
+            SlotRequest.post_id == post_id,
+            SlotRequest.requester_user_id == request.user_id,
+            SlotRequest.status.in_(["pending", "accepted"])
+        ).exists()
+    ).scalar()
     if existing_request:
         raise HTTPException(status_code=400, detail="You have already requested a slot in this post")
 
     # Check if user already has a slot
-    existing_slot = db.query(PostSlot).filter(
-        PostSlot.post_id == post_id,
-        PostSlot.user_id == request.user_id
-    ).first()
+    existing_slot = db.query(
+        db.query(PostSlot).filter(
+            PostSlot.post_id == post_id,
+            PostSlot.user_id == request.user_id
+        ).exists()
+    ).scalar()
     if existing_slot:
         raise HTTPException(status_code=400, detail="You already have a slot in this post")
 
@@ -1087,10 +975,7 @@ def request_slot(post_id: int, request: SlotRequestCreate, db: Session = Depends
     post_author = db.query(User).filter(User.id == post.author_id).first()
     
     # Check if conversation already exists between requester and post author
-    existing_conversation = db.query(Conversation).filter(
-        ((Conversation.user1_id == request.user_id) & (Conversation.user2_id == post.author_id)) |
-        ((Conversation.user1_id == post.author_id) & (Conversation.user2_id == request.user_id))
-    ).first()
+    existing_conversation = db.execute(conversation_between(request.user_id, post.author_id)).scalars().first()
     
     conversation = existing_conversation
     if not conversation:
@@ -1104,13 +989,13 @@ def request_slot(post_id: int, request: SlotRequestCreate, db: Session = Depends
     
     # Create message with slot request
     message_content = f"I'd like to help you with this! 🚀"
-    db_message = Message(
+    insert_message(
+        db,
         conversation_id=conversation.id,
         sender_id=request.user_id,
         content=message_content,
         slot_request_id=db_slot_request.id
     )
-    db.add(db_message)
     db.commit()
     db.refresh(db_slot_request)
 
@@ -1120,12 +1005,7 @@ def request_slot(post_id: int, request: SlotRequestCreate, db: Session = Depends
         "requester_user_id": db_slot_request.requester_user_id,
         "status": db_slot_request.status,
         "created_at": db_slot_request.created_at,
-        "requester_user": {
-            "id": user.id,
-            "username": user.username,
-            "full_name": user.full_name,
-            "profile_picture": user.profile_picture
-        }
+        "requester_user": user_to_dict(user)
     }
 
 
@@ -1142,8 +1022,8 @@ def request_help(post_id: int, request: HelpRequestCreate, db: Session = Depends
         raise HTTPException(status_code=400, detail="This endpoint is only for help posts")
     
     # Check if user exists
-    user = db.query(User).filter(User.id == request.helper_user_id).first()
-    if not user:
+    user_exists = db.query(db.query(User).filter(User.id == request.helper_user_id).exists()).scalar()
+    if not user_exists:
         raise HTTPException(status_code=404, detail="User not found")
     
     # Check if user is the author (can't request to help on their own post)
@@ -1151,10 +1031,12 @@ def request_help(post_id: int, request: HelpRequestCreate, db: Session = Depends
         raise HTTPException(status_code=400, detail="You cannot request to help on your own post")
     
     # Check if user already requested to help
-    existing_request = db.query(HelpRequest).filter(
-        HelpRequest.post_id == post_id,
-        HelpRequest.helper_user_id == request.helper_user_id
-    ).first()
+    existing_request = db.query(
+        db.query(HelpRequest).filter(
+            HelpRequest.post_id == post_id,
+            HelpRequest.helper_user_id == request.helper_user_id
+        ).exists()
+    ).scalar()
     if existing_request:
         raise HTTPException(status_code=400, detail="You have already requested to help on this post")
     
@@ -1165,6 +1047,7 @@ def request_help(post_id: int, request: HelpRequestCreate, db: Session = Depends
     )
     db.add(db_help_request)
     db.commit()
+    invalidate_feed_cache()
     db.refresh(db_help_request)
     
     return {
@@ -1190,7 +1073,7 @@ def get_slot_requests(post_id: int, current_user_id: int = Query(..., descriptio
 
     result = []
     for request in slot_requests:
-        user = db.query(User).filter(User.id == request.requester_user_id).first()
+        user = request.requester_user
         result.append({
             "id": request.id,
             "post_id": request.post_id,
@@ -1253,6 +1136,7 @@ def update_slot_request(post_id: int, request_id: int, update_data: SlotRequestU
         )
         db.add(db_slot)
         db.commit()
+        invalidate_feed_cache()
 
     return {"message": f"Slot request {update_data.status}", "slot_request": {
         "id": slot_request.id,
@@ -1297,10 +1181,12 @@ def handle_slot_request_from_message(message_id: int, update_data: SlotRequestUp
             raise HTTPException(status_code=400, detail="All slots are already filled")
         
         # Check if user already has a slot
-        existing_slot = db.query(PostSlot).filter(
-            PostSlot.post_id == slot_request.post_id,
-            PostSlot.user_id == slot_request.requester_user_id
-        ).first()
+        existing_slot = db.query(
+            db.query(PostSlot).filter(
+                PostSlot.post_id == slot_request.post_id,
+                PostSlot.user_id == slot_request.requester_user_id
+            ).exists()
+        ).scalar()
         if existing_slot:
             raise HTTPException(status_code=400, detail="User already has a slot in this post")
         
@@ -1315,35 +1201,36 @@ def handle_slot_request_from_message(message_id: int, update_data: SlotRequestUp
         post_content_preview = post.content[:50] + "..." if post.content and len(post.content) > 50 else (post.content or "this project")
         
         # Send a confirmation message to the requester
-        confirmation_message = Message(
+        insert_message(
+            db,
             conversation_id=message.conversation_id,
             sender_id=current_user_id,
             content=f"✅ Great! I've accepted your help request for \"{post_content_preview}\". Welcome to the team! 🎉"
         )
-        db.add(confirmation_message)
         
         # Update conversation timestamp so it appears at the top
         conversation = db.query(Conversation).filter(Conversation.id == message.conversation_id).first()
         if conversation:
-            conversation.updated_at = datetime.utcnow()
+            conversation.updated_at = SQL_NOW
     else:
         # Get post details for the message
         post_content_preview = post.content[:50] + "..." if post.content and len(post.content) > 50 else (post.content or "this project")
         
         # Send a rejection message to the requester
-        rejection_message = Message(
+        insert_message(
+            db,
             conversation_id=message.conversation_id,
             sender_id=current_user_id,
             content=f"Thank you for your interest in helping with \"{post_content_preview}\", but I've decided to go with other collaborators for this project. I appreciate your offer though! 🙏"
         )
-        db.add(rejection_message)
         
         # Update conversation timestamp so it appears at the top
         conversation = db.query(Conversation).filter(Conversation.id == message.conversation_id).first()
         if conversation:
-            conversation.updated_at = datetime.utcnow()
+            conversation.updated_at = SQL_NOW
     
     db.commit()
+    invalidate_feed_cache()
     
     return {"message": f"Slot request {update_data.status}", "slot_request": {
         "id": slot_request.id,
@@ -1368,6 +1255,7 @@ def remove_slot(post_id: int, slot_id: int, user_id: int = Query(..., descriptio
     
     db.delete(slot)
     db.commit()
+    invalidate_feed_cache()
     return {"message": "Slot removed successfully"}
 
 
@@ -1395,6 +1283,7 @@ def create_comment(post_id: int, request: CommentCreate, db: Session = Depends(g
     )
     db.add(db_comment)
     db.commit()
+    invalidate_feed_cache()
     db.refresh(db_comment)
 
     return {
@@ -1403,40 +1292,24 @@ def create_comment(post_id: int, request: CommentCreate, db: Session = Depends(g
         "author_id": db_comment.author_id,
         "content": db_comment.content,
         "created_at": db_comment.created_at,
-        "author": {
-            "id": user.id,
-            "email": user.email,
-            "username": user.username,
-            "full_name": user.full_name,
-            "bio": user.bio,
-            "profile_picture": user.profile_picture,
-            "interests": safe_json_loads(user.interests) if user.interests else [],
-            "looking_for": safe_json_loads(user.looking_for) if user.looking_for else [],
-            "location": user.location,
-            "timezone": user.timezone,
-            "availability": user.availability,
-            "linkedin_url": user.linkedin_url,
-            "github_url": user.github_url,
-            "profile_type": user.profile_type,
-            "created_at": user.created_at,
-            "is_active": user.is_active,
-            "skills": []
-        }
+        "author": user_to_dict(user, include_skills=False)
     }
 
 
 @app.get("/api/posts/{post_id}/comments", response_model=List[CommentResponse])
-def get_comments(post_id: int, db: Session = Depends(get_db)):
+async def get_comments(post_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get all comments for a post."""
-    post = db.query(Post).filter(Post.id == post_id).first()
-    if not post:
+    post_exists = (await db.execute(select(select(Post.id).where(Post.id == post_id).exists()))).scalar()
+    if not post_exists:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    comments = db.query(Comment).filter(Comment.post_id == post_id).order_by(Comment.created_at.asc()).all()
+    comments = (await db.execute(
+        select(Comment).options(selectinload(Comment.author)).where(Comment.post_id == post_id).order_by(Comment.created_at.asc())
+    )).scalars().all()
 
     result = []
     for comment in comments:
-        author = db.query(User).filter(User.id == comment.author_id).first()
+        author = comment.author
         comment_dict = {
             "id": comment.id,
             "post_id": comment.post_id,
@@ -1445,25 +1318,7 @@ def get_comments(post_id: int, db: Session = Depends(get_db)):
             "created_at": comment.created_at
         }
         if author:
-            comment_dict["author"] = {
-                "id": author.id,
-                "email": author.email,
-                "username": author.username,
-                "full_name": author.full_name,
-                "bio": author.bio,
-                "profile_picture": author.profile_picture,
-                "interests": safe_json_loads(author.interests) if author.interests else [],
-                "looking_for": safe_json_loads(author.looking_for) if author.looking_for else [],
-                "location": author.location,
-                "timezone": author.timezone,
-                "availability": author.availability,
-                "linkedin_url": author.linkedin_url,
-                "github_url": author.github_url,
-                "profile_type": author.profile_type,
-                "created_at": author.created_at,
-                "is_active": author.is_active,
-                "skills": []
-            }
+            comment_dict["author"] = user_to_dict(author, include_skills=False)
         result.append(comment_dict)
 
     return result
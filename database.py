@@ -2,19 +2,75 @@
 Database models and setup for the collaboration platform.
 Uses SQLite for simplicity, but structured for easy migration to PostgreSQL.
 """
-from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Table, Text
+from sqlalchemy import create_engine, event, inspect, text, select, func, case, literal_column, Column, Index, Integer, SmallInteger, String, Float, Boolean, DateTime, ForeignKey, Table, Text, JSON
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
-from datetime import datetime
+from sqlalchemy.orm import sessionmaker, relationship, column_property
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.types import TypeDecorator
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+from collections import defaultdict
+import os
 
 Base = declarative_base()
 
+# Relationships without an eager strategy load lazily. With COLAB_STRICT_LOADING=1
+# (development) they raise instead, so a missing selectinload() shows up as an
+# error rather than as a hidden query per row.
+STRICT_LOADING = os.getenv("COLAB_STRICT_LOADING") == "1"
+DEFAULT_LAZY = "raise_on_sql" if STRICT_LOADING else "select"
+
+# Timestamps are filled in by SQLite rather than bound from Python. The value is
+# inlined into each INSERT (tables created before this have no DEFAULT clause)
+# and kept to milliseconds, since CURRENT_TIMESTAMP only has whole seconds and
+# rows are ordered by created_at.
+SQL_NOW = literal_column("strftime('%Y-%m-%d %H:%M:%f', 'now')")
+
+
+class EnumStr(TypeDecorator):
+    """String enum stored as a small integer code.
+
+    Codes are the 1-based positions in ``values``, so new values must only ever
+    be appended. Databases migrated from the string columns keep their TEXT
+    column affinity and hand the codes back as strings, hence the int().
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, *values):
+        super().__init__()
+        self.values = values
+        self.codes = {value: code for code, value in enumerate(values, 1)}
+        self.names = {code: value for value, code in self.codes.items()}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value not in self.codes:
+            raise ValueError(f"{value!r} is not one of {', '.join(self.values)}")
+        return self.codes[value]
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else self.names[int(value)]
+
+    def literal(self, value):
+        """Return the code for value as an inline SQL literal rather than a bound parameter."""
+        return literal_column(str(self.codes[value]))
+
+
+PROJECT_STATUS = EnumStr("open", "in_progress", "completed", "cancelled")
+MATCH_STATUS = EnumStr("pending", "accepted", "rejected", "connected")
+SLOT_REQUEST_STATUS = EnumStr("pending", "accepted", "rejected")
+POST_TYPE = EnumStr("regular", "help")
+
 # Association table for many-to-many relationship between users and skills
 user_skills = Table(
     'user_skills',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
-    Column('skill_id', Integer, ForeignKey('skills.id'), primary_key=True)
+    Column('skill_id', Integer, ForeignKey('skills.id'), primary_key=True),
+    sqlite_with_rowid=False
 )
 
 # Association table for project skills needed
@@ -22,7 +78,8 @@ project_skills = Table(
     'project_skills',
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
-    Column('skill_id', Integer, ForeignKey('skills.id'), primary_key=True)
+    Column('skill_id', Integer, ForeignKey('skills.id'), primary_key=True),
+    sqlite_with_rowid=False
 )
 
 # Association table for project members
@@ -30,215 +87,418 @@ project_members = Table(
     'project_members',
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
-    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True)
+    Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
+    sqlite_with_rowid=False
 )
 
 
+# Association tables are clustered on their primary key (WITHOUT ROWID); these
+# cover lookups from the other side, e.g. "which users have skill X"
+Index("ix_user_skills_skill_user", user_skills.c.skill_id, user_skills.c.user_id)
+Index("ix_project_skills_skill_project", project_skills.c.skill_id, project_skills.c.project_id)
+Index("ix_project_members_user_project", project_members.c.user_id, project_members.c.project_id)
+
+
 class User(Base):
     """User model representing platform members."""
     __tablename__ = 'users'
     
-    id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
-    password = Column(String, nullable=True)  # Simple password for now
-    full_name = Column(String, nullable=False)
+    id = Column(Integer, primary_key=True)
+    email = Column(String(254), unique=True, index=True, nullable=False)
+    username = Column(String(50), unique=True, index=True, nullable=False)
+    password = Column(String(64), nullable=True)  # SHA-256 hex digest
+    full_name = Column(String(100), nullable=False)
     bio = Column(Text, nullable=True)
-    profile_picture = Column(String, nullable=True)  # URL or base64
-    interests = Column(Text, nullable=True)  # JSON array of interests with #
-    looking_for = Column(Text, nullable=True)  # JSON array of programming languages with #
-    location = Column(String, nullable=True)
-    timezone = Column(String, nullable=True)
-    availability = Column(String, nullable=True)  # e.g., "weekends", "evenings", "any"
-    linkedin_url = Column(String, nullable=True)
-    github_url = Column(String, nullable=True)
-    profile_type = Column(String, nullable=True)  # "Coworker" or "SoloDev"
-    created_at = Column(DateTime, default=datetime.utcnow)
-    is_active = Column(Boolean, default=True)
+    profile_picture = Column(Text, nullable=True)  # URL or base64
+    interests = Column(JSON(none_as_null=True), nullable=True)  # JSON array of interests with #
+    looking_for = Column(JSON(none_as_null=True), nullable=True)  # JSON array of programming languages with #
+    location = Column(String(255), nullable=True)
+    timezone = Column(String(64), nullable=True)
+    availability = Column(String(32), nullable=True)  # e.g., "weekends", "evenings", "any"
+    linkedin_url = Column(String(2048), nullable=True)
+    github_url = Column(String(2048), nullable=True)
+    profile_type = Column(String(32), nullable=True)  # "Coworker" or "SoloDev"
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
+    is_active = Column(Boolean, default=True, nullable=False)
     
     # Relationships
-    skills = relationship("Skill", secondary=user_skills, back_populates="users")
-    projects_owned = relationship("Project", back_populates="owner", foreign_keys="Project.owner_id")
-    projects_member = relationship("Project", secondary=project_members, back_populates="members")
-    matches_sent = relationship("Match", foreign_keys="Match.requester_id", back_populates="requester")
-    matches_received = relationship("Match", foreign_keys="Match.matched_user_id", back_populates="matched_user")
-    conversations_as_user1 = relationship("Conversation", foreign_keys="Conversation.user1_id", back_populates="user1")
-    conversations_as_user2 = relationship("Conversation", foreign_keys="Conversation.user2_id", back_populates="user2")
+    skills = relationship("Skill", secondary=user_skills, back_populates="users", lazy="selectin")
+    projects_owned = relationship("Project", back_populates="owner", foreign_keys="Project.owner_id", lazy=DEFAULT_LAZY)
+    projects_member = relationship("Project", secondary=project_members, back_populates="members", lazy=DEFAULT_LAZY)
+    matches_sent = relationship("Match", foreign_keys="Match.requester_id", back_populates="requester", lazy=DEFAULT_LAZY)
+    matches_received = relationship("Match", foreign_keys="Match.matched_user_id", back_populates="matched_user", lazy=DEFAULT_LAZY)
+    conversations_as_user1 = relationship("Conversation", foreign_keys="Conversation.user1_id", back_populates="user1", lazy=DEFAULT_LAZY)
+    conversations_as_user2 = relationship("Conversation", foreign_keys="Conversation.user2_id", back_populates="user2", lazy=DEFAULT_LAZY)
 
 
 class Skill(Base):
     """Skill model representing different skills/technologies."""
     __tablename__ = 'skills'
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, index=True, nullable=False)
-    category = Column(String, nullable=True)  # e.g., "programming", "design", "marketing"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), unique=True, index=True, nullable=False)
+    category = Column(String(50), nullable=True)  # e.g., "programming", "design", "marketing"
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
     
     # Relationships
-    users = relationship("User", secondary=user_skills, back_populates="skills")
-    projects = relationship("Project", secondary=project_skills, back_populates="required_skills")
+    users = relationship("User", secondary=user_skills, back_populates="skills", lazy=DEFAULT_LAZY)
+    projects = relationship("Project", secondary=project_skills, back_populates="required_skills", lazy=DEFAULT_LAZY)
 
 
 class Project(Base):
     """Project model representing collaboration opportunities."""
     __tablename__ = 'projects'
     
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, nullable=False)
+    id = Column(Integer, primary_key=True)
+    title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
     owner_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    status = Column(String, default="open")  # "open", "in_progress", "completed", "cancelled"
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    status = Column(PROJECT_STATUS, default="open", nullable=False)  # "open", "in_progress", "completed", "cancelled"
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
+    updated_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, onupdate=SQL_NOW, nullable=False)
     
     # Relationships
-    owner = relationship("User", foreign_keys=[owner_id], back_populates="projects_owned")
-    members = relationship("User", secondary=project_members, back_populates="projects_member")
-    required_skills = relationship("Skill", secondary=project_skills, back_populates="projects")
+    owner = relationship("User", foreign_keys=[owner_id], back_populates="projects_owned", lazy=DEFAULT_LAZY)
+    members = relationship("User", secondary=project_members, back_populates="projects_member", lazy="selectin")
+    required_skills = relationship("Skill", secondary=project_skills, back_populates="projects", lazy="selectin")
 
 
 class Match(Base):
     """Match model representing connections between users."""
     __tablename__ = 'matches'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     requester_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     matched_user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     project_id = Column(Integer, ForeignKey('projects.id'), nullable=True)
     match_score = Column(Float, nullable=False)
-    status = Column(String, default="pending")  # "pending", "accepted", "rejected", "connected"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(MATCH_STATUS, default="pending", nullable=False)  # "pending", "accepted", "rejected", "connected"
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
     
     # Relationships
-    requester = relationship("User", foreign_keys=[requester_id], back_populates="matches_sent")
-    matched_user = relationship("User", foreign_keys=[matched_user_id], back_populates="matches_received")
-    project = relationship("Project")
+    requester = relationship("User", foreign_keys=[requester_id], back_populates="matches_sent", lazy="joined")
+    matched_user = relationship("User", foreign_keys=[matched_user_id], back_populates="matches_received", lazy="joined")
+    project = relationship("Project", lazy=DEFAULT_LAZY)
 
 
 class Conversation(Base):
     """Conversation model representing a chat between two users."""
     __tablename__ = 'conversations'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user1_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     user2_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
+    updated_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, onupdate=SQL_NOW, nullable=False)
+    # Unread messages for each side, kept current by the UNREAD_COUNT_TRIGGERS
+    unread_for_user1 = Column(Integer, default=0, nullable=False)
+    unread_for_user2 = Column(Integer, default=0, nullable=False)
     
     # Relationships
-    user1 = relationship("User", foreign_keys=[user1_id], back_populates="conversations_as_user1")
-    user2 = relationship("User", foreign_keys=[user2_id], back_populates="conversations_as_user2")
-    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan")
+    user1 = relationship("User", foreign_keys=[user1_id], back_populates="conversations_as_user1", lazy=DEFAULT_LAZY)
+    user2 = relationship("User", foreign_keys=[user2_id], back_populates="conversations_as_user2", lazy=DEFAULT_LAZY)
+    messages = relationship("Message", back_populates="conversation", cascade="all, delete-orphan", lazy=DEFAULT_LAZY)
+
+    @classmethod
+    def inbox_query(cls, user_id: int):
+        """Select a user's conversations with their latest message and unread count.
+
+        One statement for the whole inbox: ROW_NUMBER() picks each
+        conversation's newest message. Rows come back as plain mappings with
+        the message columns prefixed ``last_``.
+        """
+        mine = (cls.user1_id == user_id) | (cls.user2_id == user_id)
+        ranked = (
+            select(
+                Message.id, Message.conversation_id, Message.sender_id, Message.content,
+                Message.is_initial_greeting, Message.read, Message.created_at,
+                func.row_number().over(
+                    partition_by=Message.conversation_id,
+                    order_by=(Message.created_at.desc(), Message.id.desc())
+                ).label("rn")
+            )
+            .join(cls, Message.conversation_id == cls.id)
+            .where(mine)
+            .subquery()
+        )
+        return (
+            select(
+                cls.id, cls.user1_id, cls.user2_id, cls.created_at, cls.updated_at,
+                case((cls.user1_id == user_id, cls.unread_for_user1), else_=cls.unread_for_user2).label("unread_count"),
+                *(column.label(f"last_{column.name}") for column in ranked.c if column.name != "rn")
+            )
+            .outerjoin(ranked, (ranked.c.conversation_id == cls.id) & (ranked.c.rn == 1))
+            .where(mine)
+            .order_by(cls.updated_at.desc())
+        )
 
 
 class Message(Base):
     """Message model representing individual messages in a conversation."""
     __tablename__ = 'messages'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     conversation_id = Column(Integer, ForeignKey('conversations.id'), nullable=False)
     sender_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     content = Column(Text, nullable=False)
-    is_initial_greeting = Column(Boolean, default=False)  # True for the first pre-written message
+    is_initial_greeting = Column(Boolean, default=False, nullable=False)  # True for the first pre-written message
     slot_request_id = Column(Integer, ForeignKey('slot_requests.id'), nullable=True)  # Link to slot request if this is a slot request message
-    read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    read = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
     
     # Relationships
-    conversation = relationship("Conversation", back_populates="messages")
-    sender = relationship("User", foreign_keys=[sender_id])
-    slot_request = relationship("SlotRequest", foreign_keys=[slot_request_id])
+    conversation = relationship("Conversation", back_populates="messages", lazy=DEFAULT_LAZY)
+    sender = relationship("User", foreign_keys=[sender_id], lazy="joined")
+    slot_request = relationship("SlotRequest", foreign_keys=[slot_request_id], lazy=DEFAULT_LAZY)
 
 
 class Post(Base):
     """Post model representing user posts with collaboration slots."""
     __tablename__ = 'posts'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     author_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     content = Column(Text, nullable=True)  # Text content
-    image = Column(Text, nullable=True)  # Base64 image or URL
     slot_count = Column(Integer, nullable=False, default=1)  # Number of slots (1-5)
-    post_type = Column(String(20), nullable=True, default='regular')  # 'regular' or 'help'
-    created_at = Column(DateTime, default=datetime.utcnow)
+    post_type = Column(POST_TYPE, nullable=False, default='regular')  # 'regular' or 'help'
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
     
     # Relationships
-    author = relationship("User", foreign_keys=[author_id])
-    slots = relationship("PostSlot", back_populates="post", cascade="all, delete-orphan")
-    help_requests = relationship("HelpRequest", back_populates="post", cascade="all, delete-orphan")
-    slot_requests = relationship("SlotRequest", back_populates="post", cascade="all, delete-orphan")
-    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan")
+    author = relationship("User", foreign_keys=[author_id], lazy="joined")
+    slots = relationship("PostSlot", back_populates="post", cascade="all, delete-orphan", lazy="selectin")
+    help_requests = relationship("HelpRequest", back_populates="post", cascade="all, delete-orphan", lazy="selectin")
+    slot_requests = relationship("SlotRequest", back_populates="post", cascade="all, delete-orphan", lazy=DEFAULT_LAZY)
+    comments = relationship("Comment", back_populates="post", cascade="all, delete-orphan", lazy=DEFAULT_LAZY)
+    # Only loaded where asked for with selectinload(Post.image)
+    image = relationship("PostImage", uselist=False, lazy="noload", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class PostImage(Base):
+    """PostImage model holding a post's image outside the posts row.
+
+    Base64 images are large enough to spill posts rows into overflow pages,
+    so they live here and every other posts query stays narrow.
+    """
+    __tablename__ = 'post_images'
+    
+    post_id = Column(Integer, ForeignKey('posts.id', ondelete='CASCADE'), primary_key=True)
+    image = Column(Text, nullable=False)  # Base64 image or URL
 
 
 class PostSlot(Base):
     """PostSlot model representing filled slots in a post."""
     __tablename__ = 'post_slots'
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
     
     # Relationships
-    post = relationship("Post", back_populates="slots")
-    user = relationship("User", foreign_keys=[user_id])
+    post = relationship("Post", back_populates="slots", lazy=DEFAULT_LAZY)
+    user = relationship("User", foreign_keys=[user_id], lazy="joined")
 
 
 class HelpRequest(Base):
     """HelpRequest model representing help requests for posts."""
     __tablename__ = 'help_requests'
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
     helper_user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
 
     # Relationships
-    post = relationship("Post", back_populates="help_requests")
-    helper_user = relationship("User", foreign_keys=[helper_user_id])
+    post = relationship("Post", back_populates="help_requests", lazy=DEFAULT_LAZY)
+    helper_user = relationship("User", foreign_keys=[helper_user_id], lazy="joined")
 
 
 class SlotRequest(Base):
     """SlotRequest model representing pending slot requests for posts."""
     __tablename__ = 'slot_requests'
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
     requester_user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    status = Column(String(20), default="pending")  # "pending", "accepted", "rejected"
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(SLOT_REQUEST_STATUS, default="pending", nullable=False)  # "pending", "accepted", "rejected"
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
 
     # Relationships
-    post = relationship("Post", back_populates="slot_requests")
-    requester_user = relationship("User", foreign_keys=[requester_user_id])
+    post = relationship("Post", back_populates="slot_requests", lazy=DEFAULT_LAZY)
+    requester_user = relationship("User", foreign_keys=[requester_user_id], lazy="joined")
 
 
 class Comment(Base):
     """Comment model representing comments on posts."""
     __tablename__ = 'comments'
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     post_id = Column(Integer, ForeignKey('posts.id'), nullable=False)
     author_id = Column(Integer, ForeignKey('users.id'), nullable=False)
     content = Column(Text, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=SQL_NOW, server_default=SQL_NOW, nullable=False)
 
     # Relationships
-    post = relationship("Post", back_populates="comments")
-    author = relationship("User", foreign_keys=[author_id])
+    post = relationship("Post", back_populates="comments", lazy=DEFAULT_LAZY)
+    author = relationship("User", foreign_keys=[author_id], lazy="joined")
+
+
+class SuggestedMatch(Base):
+    """SuggestedMatch model holding a user's precomputed top matches.
+
+    Filled by matching.recompute_suggestions(); rank 1 is the best candidate.
+    """
+    __tablename__ = 'suggested_matches'
+    __table_args__ = {"sqlite_with_rowid": False}
+
+    user_id = Column(Integer, ForeignKey('users.id'), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    candidate_id = Column(Integer, ForeignKey('users.id'), nullable=False)
+    score = Column(Float, nullable=False)
+
+
+# Comment count for feed rendering; deferred so it only runs when a query undefers it
+Post.comment_count = column_property(
+    select(func.count(Comment.id)).where(Comment.post_id == Post.id).correlate_except(Comment).scalar_subquery(),
+    deferred=True
+)
+
+# Indexes on the foreign keys the API filters, joins and orders by
+Index("ix_messages_conv_created", Message.conversation_id, Message.created_at)
+Index("ix_matches_requester_status", Match.requester_id, Match.status)
+Index("ix_matches_matched_status", Match.matched_user_id, Match.status)
+Index("ix_post_slots_post", PostSlot.post_id)
+Index("ix_help_requests_post", HelpRequest.post_id)
+Index("ix_slot_requests_post_status", SlotRequest.post_id, SlotRequest.status)
+Index("ix_comments_post_created", Comment.post_id, Comment.created_at)
+Index("ix_conversations_user_pair", Conversation.user1_id, Conversation.user2_id)
+
+# Partial indexes covering only the small "still open" subset of each status column.
+# SQLite only picks one when the query's WHERE repeats the index predicate with the
+# same literal, so queries must filter with these expressions: a plain
+# `Match.status == "pending"` binds the code as a parameter and skips the index.
+# No endpoint lists pending matches/slot requests or open projects on its own yet.
+MATCH_PENDING = Match.status == MATCH_STATUS.literal("pending")
+SLOT_REQUEST_PENDING = SlotRequest.status == SLOT_REQUEST_STATUS.literal("pending")
+PROJECT_OPEN = Project.status == PROJECT_STATUS.literal("open")
+Index("ix_matches_pending", Match.requester_id, sqlite_where=MATCH_PENDING)
+Index("ix_slot_requests_pending", SlotRequest.post_id, sqlite_where=SLOT_REQUEST_PENDING)
+Index("ix_projects_open", Project.owner_id, sqlite_where=PROJECT_OPEN)
 
 
 # Database setup
 SQLALCHEMY_DATABASE_URL = "sqlite:///./collab_platform.db"
 
+# Keep a pool of open connections so requests reuse them instead of reconnecting
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, 
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    query_cache_size=1200  # Compiled SQL cache shared across requests
 )
 
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Configure each new SQLite connection once, when the pool opens it.
+
+    WAL lets readers proceed while a writer commits, and synchronous=NORMAL
+    only fsyncs at WAL checkpoints instead of on every commit.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB memory-mapped reads
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+event.listen(engine, "connect", set_sqlite_pragmas)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for read-heavy endpoints so DB I/O does not hold a threadpool worker
+ASYNC_SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("sqlite:", "sqlite+aiosqlite:", 1)
+
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL)
+event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+
+# Bump when migrate_db() gains a step so existing databases re-run it
+SCHEMA_VERSION = 9
+
+# One row per (user, interest tag) with the tag normalized the same way as
+# calculate_interest_match(), so tag lookups can run in SQLite via json_each
+USER_INTEREST_TAGS_VIEW = """
+CREATE VIEW IF NOT EXISTS user_interest_tags AS
+SELECT u.id AS user_id, lower(replace(je.value, '#', '')) AS tag
+FROM users u, json_each(u.interests) je
+WHERE u.interests IS NOT NULL
+"""
+
+# Keep conversations.unread_for_user1/2 in step with messages.read. A message
+# counts as unread for the participant who did not send it.
+UNREAD_COUNT_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_messages_unread_insert AFTER INSERT ON messages
+    WHEN NEW.read = 0
+    BEGIN
+        UPDATE conversations
+        SET unread_for_user1 = unread_for_user1 + (NEW.sender_id != user1_id),
+            unread_for_user2 = unread_for_user2 + (NEW.sender_id != user2_id)
+        WHERE id = NEW.conversation_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_messages_unread_update AFTER UPDATE OF read ON messages
+    WHEN OLD.read != NEW.read
+    BEGIN
+        UPDATE conversations
+        SET unread_for_user1 = unread_for_user1 + (NEW.sender_id != user1_id) * (OLD.read - NEW.read),
+            unread_for_user2 = unread_for_user2 + (NEW.sender_id != user2_id) * (OLD.read - NEW.read)
+        WHERE id = NEW.conversation_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_messages_unread_delete AFTER DELETE ON messages
+    WHEN OLD.read = 0
+    BEGIN
+        UPDATE conversations
+        SET unread_for_user1 = unread_for_user1 - (OLD.sender_id != user1_id),
+            unread_for_user2 = unread_for_user2 - (OLD.sender_id != user2_id)
+        WHERE id = OLD.conversation_id;
+    END
+    """,
+]
+
+UNREAD_COUNT_BACKFILL = """
+UPDATE conversations SET
+    unread_for_user1 = (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = conversations.id AND m.read = 0 AND m.sender_id != conversations.user1_id),
+    unread_for_user2 = (SELECT COUNT(*) FROM messages m WHERE m.conversation_id = conversations.id AND m.read = 0 AND m.sender_id != conversations.user2_id)
+"""
+
+# Columns added after the first release: (table, column, SQL type)
+COLUMN_MIGRATIONS = [
+    ("users", "password", "VARCHAR"),
+    ("users", "profile_picture", "VARCHAR"),
+    ("users", "interests", "TEXT"),
+    ("users", "looking_for", "TEXT"),
+    ("users", "linkedin_url", "VARCHAR"),
+    ("users", "github_url", "VARCHAR"),
+    ("users", "profile_type", "VARCHAR"),
+    ("posts", "post_type", "VARCHAR(20) DEFAULT 'regular'"),
+    ("messages", "slot_request_id", "INTEGER"),
+    ("conversations", "unread_for_user1", "INTEGER NOT NULL DEFAULT 0"),
+    ("conversations", "unread_for_user2", "INTEGER NOT NULL DEFAULT 0"),
+]
+
 
 def init_db():
     """Initialize the database by creating all tables."""
@@ -247,114 +507,153 @@ def init_db():
 
 
 def migrate_db():
-    """Add missing columns to existing database tables."""
-    from sqlalchemy import inspect, text
-    
+    """Add missing columns to existing database tables.
+
+    The applied schema version is kept in SQLite's user_version pragma, so a
+    database that is already current costs a single pragma read.
+    """
+    with engine.connect() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() == SCHEMA_VERSION:
+            return
+
     inspector = inspect(engine)
-    table_names = inspector.get_table_names()
-    
-    # Only migrate if users table exists
-    if 'users' not in table_names:
-        return
-    
-    existing_columns = [col['name'] for col in inspector.get_columns('users')]
+    table_names = set(inspector.get_table_names())
+    existing_columns = {
+        table: {col['name'] for col in inspector.get_columns(table)}
+        for table in {table for table, _, _ in COLUMN_MIGRATIONS} & table_names
+    }
     
     with engine.begin() as conn:  # Use begin() for automatic transaction handling
-        # Add password column if it doesn't exist
-        if 'password' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN password VARCHAR"))
-                print("Added 'password' column to users table")
-            except Exception as e:
-                print(f"Could not add password column: {e}")
-        
-        # Add profile_picture column if it doesn't exist
-        if 'profile_picture' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN profile_picture VARCHAR"))
-                print("Added 'profile_picture' column to users table")
-            except Exception as e:
-                print(f"Could not add profile_picture column: {e}")
-        
-        # Add interests column if it doesn't exist
-        if 'interests' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN interests TEXT"))
-                print("Added 'interests' column to users table")
-            except Exception as e:
-                print(f"Could not add interests column: {e}")
-        
-        # Add looking_for column if it doesn't exist
-        if 'looking_for' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN looking_for TEXT"))
-                print("Added 'looking_for' column to users table")
-            except Exception as e:
-                print(f"Could not add looking_for column: {e}")
-        
-        # Add linkedin_url column if it doesn't exist
-        if 'linkedin_url' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN linkedin_url VARCHAR"))
-                print("Added 'linkedin_url' column to users table")
-            except Exception as e:
-                print(f"Could not add linkedin_url column: {e}")
-        
-        # Add github_url column if it doesn't exist
-        if 'github_url' not in existing_columns:
+        for table, column, column_type in COLUMN_MIGRATIONS:
+            if table not in existing_columns or column in existing_columns[table]:
+                continue
             try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN github_url VARCHAR"))
-                print("Added 'github_url' column to users table")
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+                print(f"Added '{column}' column to {table} table")
             except Exception as e:
-                print(f"Could not add github_url column: {e}")
-        
-        # Add profile_type column if it doesn't exist
-        if 'profile_type' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN profile_type VARCHAR"))
-                print("Added 'profile_type' column to users table")
-            except Exception as e:
-                print(f"Could not add profile_type column: {e}")
-        if 'linkedin_url' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN linkedin_url VARCHAR"))
-                print("Added 'linkedin_url' column to users table")
-            except Exception as e:
-                print(f"Could not add linkedin_url column: {e}")
-        
-        # Add github_url column if it doesn't exist
-        if 'github_url' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN github_url VARCHAR"))
-                print("Added 'github_url' column to users table")
-            except Exception as e:
-                print(f"Could not add github_url column: {e}")
-
-    # Check and migrate posts table
-    if 'posts' in table_names:
-        posts_columns = [col['name'] for col in inspector.get_columns('posts')]
-
-        with engine.begin() as conn:
-            # Add post_type column if it doesn't exist
-            if 'post_type' not in posts_columns:
+                print(f"Could not add {column} column to {table} table: {e}")
+
+        # Post images moved to post_images; copy them over and drop the old column
+        if 'image' in existing_columns.get('posts', ()):
+            conn.execute(text("INSERT OR IGNORE INTO post_images (post_id, image) SELECT id, image FROM posts WHERE image IS NOT NULL"))
+            conn.execute(text("ALTER TABLE posts DROP COLUMN image"))
+            print("Moved post images to post_images table")
+
+        # interests/looking_for are read as JSON; clear values that are not valid JSON
+        if 'users' in existing_columns:
+            for column in ('interests', 'looking_for'):
+                conn.execute(text(f"UPDATE users SET {column} = NULL WHERE {column} IS NOT NULL AND json_valid({column}) = 0"))
+        conn.execute(text(USER_INTEREST_TAGS_VIEW))
+
+        for trigger in UNREAD_COUNT_TRIGGERS:
+            conn.execute(text(trigger))
+        conn.execute(text(UNREAD_COUNT_BACKFILL))
+
+        # status/post_type used to hold the strings themselves; convert them to
+        # EnumStr codes and rebuild the partial indexes that filter on them.
+        # Codes already converted are kept; unknown strings get the column default
+        for table in Base.metadata.sorted_tables:
+            for column in table.columns:
+                if isinstance(column.type, EnumStr):
+                    codes = column.type.codes
+                    cases = " ".join(
+                        f"WHEN '{value}' THEN {code} WHEN '{code}' THEN {code}" for value, code in codes.items()
+                    )
+                    fallback = codes[column.default.arg] if column.default is not None else "NULL"
+                    conn.execute(text(
+                        f"UPDATE {table.name} SET {column.name} = CASE CAST({column.name} AS TEXT) {cases} ELSE {fallback} END "
+                        f"WHERE {column.name} IS NOT NULL"
+                    ))
+            for index in table.indexes:
+                if index.dialect_options["sqlite"]["where"] is not None:
+                    conn.execute(text(f"DROP INDEX IF EXISTS {index.name}"))
+
+        # Columns declared NOT NULL later on may still hold NULLs in older
+        # databases (SQLite cannot add the constraint in place); fill in defaults
+        for table in Base.metadata.sorted_tables:
+            for column in table.columns:
+                if not column.nullable and column.default is not None and not column.default.is_callable:
+                    conn.execute(table.update().where(column.is_(None)).values({column.name: column.default.arg}))
+
+        # Primary keys used to declare index=True as well, which built a duplicate index
+        for table in Base.metadata.sorted_tables:
+            conn.execute(text(f"DROP INDEX IF EXISTS ix_{table.name}_id"))
+
+        # Indexes added to the models are not created by create_all() on existing tables
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
                 try:
-                    conn.execute(text("ALTER TABLE posts ADD COLUMN post_type VARCHAR(20) DEFAULT 'regular'"))
-                    print("Added 'post_type' column to posts table")
+                    index.create(conn, checkfirst=True)
                 except Exception as e:
-                    print(f"Could not add post_type column to posts table: {e}")
+                    print(f"Could not create index {index.name}: {e}")
 
-    # Check and migrate messages table
-    if 'messages' in table_names:
-        messages_columns = [col['name'] for col in inspector.get_columns('messages')]
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-        with engine.begin() as conn:
-            # Add slot_request_id column if it doesn't exist
-            if 'slot_request_id' not in messages_columns:
-                try:
-                    conn.execute(text("ALTER TABLE messages ADD COLUMN slot_request_id INTEGER"))
-                    print("Added 'slot_request_id' column to messages table")
-                except Exception as e:
-                    print(f"Could not add slot_request_id column to messages table: {e}")
+
+# Skills are read far more often than they change, so the full list is cached
+# and keyed on a version that is bumped whenever a commit touches the table.
+skills_version = 0
+
+# Same idea per user: a user's version is bumped on every committed change to
+# the user row or its skills, so cached profile cards can check freshness.
+profile_versions: Dict[int, int] = defaultdict(int)
+
+# Bumped alongside profile_versions for any user, for caches built over all users
+users_version = 0
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def track_cached_changes(session, flush_context):
+    """Remember that this transaction wrote Skill or User rows."""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Skill):
+            # Linking a skill to a user or project only dirties it through the backref
+            if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+                continue
+            session.info["skills_changed"] = True
+        elif isinstance(obj, User):
+            session.info.setdefault("users_changed", set()).add(obj.id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def bump_cache_versions(session):
+    """Invalidate cached skills and profiles once their writes are committed."""
+    global skills_version, users_version
+    if session.info.pop("skills_changed", False):
+        skills_version += 1
+    users_changed = session.info.pop("users_changed", ())
+    for user_id in users_changed:
+        profile_versions[user_id] += 1
+    if users_changed:
+        users_version += 1
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def reset_cached_changes(session):
+    """Forget pending Skill/User writes when the transaction is rolled back."""
+    session.info.pop("skills_changed", None)
+    session.info.pop("users_changed", None)
+
+
+@lru_cache(maxsize=1)
+def _all_skills_cached(version: int) -> Tuple[Tuple[int, str, Optional[str]], ...]:
+    with SessionLocal() as db:
+        return tuple(tuple(row) for row in db.execute(select(Skill.id, Skill.name, Skill.category).order_by(Skill.id)))
+
+
+def get_skills_cached() -> Tuple[Tuple[int, str, Optional[str]], ...]:
+    """Return all skills as immutable (id, name, category) tuples."""
+    return _all_skills_cached(skills_version)
+
+
+def profile_version(user_id: int) -> Tuple[int, int]:
+    """Return a key that changes whenever the user's profile card would change."""
+    return profile_versions.get(user_id, 0), skills_version
+
+
+def all_profiles_version() -> Tuple[int, int]:
+    """Return a key that changes whenever any user's profile or skills could change."""
+    return users_version, skills_version
 
 
 def get_db():
@@ -365,3 +664,9 @@ def get_db():
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
@@ -1,57 +1,212 @@
 """
 Complementary skill matching algorithm.
-Finds users with skills that complement the requester's needs.
+Finds users with skills that complement the requester's needs, and scores
+shared interests between users.
 """
-from typing import List, Dict, Set, Tuple, Optional
-from database import User, Skill
-import json
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Iterable, List, Dict, Set, Tuple, Optional
+from functools import lru_cache
+import sys
+import threading
+import numpy as np
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+from database import SessionLocal, User, Skill, SuggestedMatch, all_profiles_version
+import orjson
+
+
+__all__ = [
+    "MatchDetails",
+    "compute_complementary_match",
+    "find_best_matches",
+    "calculate_interest_match",
+    "get_interest_match_for_user",
+    "batch_interest_match",
+    "score_all",
+    "interest_list",
+    "interest_set",
+    "get_suggested_matches",
+    "refresh_suggestions",
+    "suggestions_current",
+]
+
+
+class BitsetIndex:
+    """
+    Maps lowercase names (skills, interests) to bit positions so name sets can
+    be packed into uint64 bitset rows. Positions are only ever appended, so
+    rows packed earlier stay valid as the vocabulary grows.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.positions: Dict[str, int] = {}
+    
+    @property
+    def words(self) -> int:
+        return max(1, (len(self.positions) + 63) // 64)
+    
+    def bitsets(self, skill_sets: List[Iterable[str]]) -> np.ndarray:
+        """Pack name sets into a (len(skill_sets), words) uint64 matrix."""
+        rows, columns = [], []
+        # Locked so concurrent callers never hand out the same position twice
+        with self.lock:
+            for row, names in enumerate(skill_sets):
+                for name in names:
+                    rows.append(row)
+                    columns.append(self.positions.setdefault(name, len(self.positions)))
+            words = self.words
+        matrix = np.zeros((len(skill_sets), words), dtype=np.uint64)
+        columns = np.asarray(columns, dtype=np.uint64)
+        np.bitwise_or.at(matrix, (np.asarray(rows, dtype=np.intp), (columns >> np.uint64(6)).astype(np.intp)), np.uint64(1) << (columns & np.uint64(63)))
+        return matrix
+    
+    def known(self, names: Iterable[str]) -> FrozenSet[str]:
+        """The names that already have a position, without adding the others."""
+        return frozenset(name for name in names if name in self.positions)
+
+
+SKILL_INDEX = BitsetIndex()
+INTEREST_INDEX = BitsetIndex()
+
+# Highest score a candidate without any needed skill can reach: full
+# complement, capped shared bonus and best availability
+ZERO_COVERAGE_MAX_SCORE = 0.3 + 0.15 * 0.3 + 0.05 * 0.2
+
+# Number of candidates materialized per user in suggested_matches
+SUGGESTIONS_K = 50
+
+# all_profiles_version() the stored suggested_matches were computed at; they
+# are only served while it is still current
+suggestions_version: Optional[Tuple[int, int]] = None
+
+
+@lru_cache(maxsize=4096)
+def _lower_skill_set(names: Tuple[str, ...]) -> FrozenSet[str]:
+    # Interned, so every set holds the same string objects and comparisons
+    # between them short-circuit on identity
+    return frozenset(sys.intern(name.lower()) for name in names)
+
+
+def skill_set(user: User) -> FrozenSet[str]:
+    """
+    Lowercased skill names of a user. Cached on the names themselves, so an
+    edited skill list simply maps to a different entry.
+    """
+    return _lower_skill_set(tuple(s.name for s in user.skills))
+
+
+@dataclass(frozen=True, slots=True)
+class MatchDetails:
+    """
+    Score breakdown of one match. The skill lists are derived from the stored
+    sets only when read, so candidates that are not shown never sort them.
+    """
+    coverage_score: float
+    complement_score: float
+    shared_bonus: float
+    availability_score: float
+    requester_skills: FrozenSet[str]
+    candidate_skills: FrozenSet[str]
+    needs_set: FrozenSet[str]
+    
+    @property
+    def complementary_skills(self) -> List[str]:
+        return sorted(self.candidate_skills - self.requester_skills)
+    
+    @property
+    def shared_skills(self) -> List[str]:
+        return sorted(self.requester_skills & self.candidate_skills)
+    
+    @property
+    def covered_needs(self) -> List[str]:
+        return sorted(self.needs_set & self.candidate_skills)
+    
+    @property
+    def missing_skills(self) -> List[str]:
+        return sorted(self.needs_set - self.candidate_skills)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """The match_reasons breakdown returned by the API."""
+        return {
+            "coverage_score": self.coverage_score,
+            "complement_score": self.complement_score,
+            "shared_bonus": self.shared_bonus,
+            "availability_score": self.availability_score,
+            "complementary_skills": self.complementary_skills,
+            "shared_skills": self.shared_skills,
+            "covered_needs": self.covered_needs,
+            "missing_skills": self.missing_skills,
+            "total_skills_candidate": len(self.candidate_skills),
+            "total_skills_requester": len(self.requester_skills)
+        }
 
 
 def compute_complementary_match(
     requester: User,
     candidate: User,
     required_skills: Optional[List[str]] = None
-) -> Tuple[float, Dict[str, any]]:
+) -> Tuple[float, MatchDetails]:
     """
     Compute a match score between requester and candidate based on complementary skills.
     
     Returns:
         Tuple of (match_score, match_details)
     """
-    requester_skills: Set[str] = {s.name.lower() for s in requester.skills}
-    candidate_skills: Set[str] = {s.name.lower() for s in candidate.skills}
+    return _score_with_details(_prepare_context(requester, required_skills), requester, candidate)
+
+
+def _prepare_context(
+    requester: User,
+    required_skills: Optional[List[str]] = None
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Requester-side sets shared by every candidate: (requester_skills, needs_set)."""
+    requester_skills = skill_set(requester)
     
     # If specific skills are required, use those; otherwise use requester's skills as needs
     if required_skills:
-        needs_set = {s.lower() for s in required_skills}
+        needs_set = frozenset(sys.intern(s.lower()) for s in required_skills)
     else:
-        needs_set = requester_skills.copy()
+        needs_set = requester_skills
     
-    # Calculate different aspects of the match
-    shared_skills = requester_skills.intersection(candidate_skills)
-    complementary_skills = candidate_skills - requester_skills  # Skills candidate has that requester lacks
-    covered_needs = needs_set.intersection(candidate_skills)  # How many needs the candidate covers
-    missing_skills = needs_set - candidate_skills  # Needs not covered by candidate
+    return requester_skills, needs_set
+
+
+@lru_cache(maxsize=50000)
+def _score(
+    context: Tuple[FrozenSet[str], FrozenSet[str]],
+    candidate_skills: FrozenSet[str],
+    availability_score: float
+) -> Tuple[float, MatchDetails]:
+    """
+    Score one candidate against a context from _prepare_context().
+    
+    Cached on its inputs, which are everything the score depends on, so a
+    pair is only re-scored after either side's skills or availability change.
+    
+    Returns:
+        Tuple of (match_score, match_details)
+    """
+    requester_skills, needs_set = context
+    
+    # Calculate different aspects of the match; only the sizes are needed, and
+    # isdisjoint() skips building an intersection that would be empty
+    shared_count = 0 if candidate_skills.isdisjoint(requester_skills) else len(requester_skills & candidate_skills)
+    complementary_count = len(candidate_skills) - shared_count  # Skills candidate has that requester lacks
+    covered_count = 0 if candidate_skills.isdisjoint(needs_set) else len(needs_set & candidate_skills)  # How many needs the candidate covers
     
     # Score components
     # 1. Skill coverage: How well candidate covers the required skills (0-1)
-    coverage_score = len(covered_needs) / max(1, len(needs_set))
+    coverage_score = covered_count / max(1, len(needs_set))
     
     # 2. Complementarity: How many unique skills candidate adds (normalized, 0-1)
-    complement_score = min(1.0, len(complementary_skills) / 10.0)  # Normalize by expected max
+    complement_score = min(1.0, complementary_count / 10.0)  # Normalize by expected max
     
     # 3. Shared skills bonus: Having some overlap is good for collaboration (0-0.3)
-    shared_bonus = min(0.3, len(shared_skills) / 5.0)
-    
-    # 4. Availability match: Same timezone or flexible availability (0-0.2)
-    availability_score = 0.0
-    if requester.availability and candidate.availability:
-        if candidate.availability.lower() == "any" or requester.availability.lower() == "any":
-            availability_score = 0.2
-        elif requester.timezone and candidate.timezone and requester.timezone == candidate.timezone:
-            availability_score = 0.15
-        elif requester.availability.lower() == candidate.availability.lower():
-            availability_score = 0.1
+    shared_bonus = min(0.3, shared_count / 5.0)
+    
+    # 4. Availability match: Same timezone or flexible availability (0-0.2),
+    # from compute_availability_score()
     
     # Final weighted score (weights favor complementarity and coverage)
     final_score = (
@@ -61,20 +216,258 @@ def compute_complementary_match(
         0.05 * availability_score   # Bonus: can work together
     )
     
-    match_details = {
-        "coverage_score": round(coverage_score, 3),
-        "complement_score": round(complement_score, 3),
-        "shared_bonus": round(shared_bonus, 3),
-        "availability_score": round(availability_score, 3),
-        "complementary_skills": sorted([s for s in candidate_skills if s not in requester_skills]),
-        "shared_skills": sorted(list(shared_skills)),
-        "covered_needs": sorted(list(covered_needs)),
-        "missing_skills": sorted(list(missing_skills)),
-        "total_skills_candidate": len(candidate_skills),
-        "total_skills_requester": len(requester_skills)
-    }
+    details = MatchDetails(
+        coverage_score=round(coverage_score, 3),
+        complement_score=round(complement_score, 3),
+        shared_bonus=round(shared_bonus, 3),
+        availability_score=round(availability_score, 3),
+        requester_skills=requester_skills,
+        candidate_skills=candidate_skills,
+        needs_set=needs_set
+    )
     
-    return round(final_score, 4), match_details
+    return round(final_score, 4), details
+
+
+def _score_with_details(
+    context: Tuple[FrozenSet[str], FrozenSet[str]],
+    requester: User,
+    candidate: User
+) -> Tuple[float, MatchDetails]:
+    """_score() for a candidate whose skill set is not at hand yet."""
+    return _score(context, skill_set(candidate), compute_availability_score(requester, candidate))
+
+
+# Availability codes: 0 when not set, 1 for "any", then one per other value
+AVAILABILITY_CODES: Dict[str, int] = {"any": 1}
+
+# Guards AVAILABILITY_CODES and TIMEZONE_CODES, so two new values never share a code
+_CODES_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1024)
+def availability_code(availability: Optional[str]) -> int:
+    """Small integer code of an availability value, compared case-insensitively."""
+    if not availability:
+        return 0
+    with _CODES_LOCK:
+        return AVAILABILITY_CODES.setdefault(availability.lower(), len(AVAILABILITY_CODES) + 1)
+
+
+# Timezone codes: 0 when not set, then one per value (compared exactly)
+TIMEZONE_CODES: Dict[str, int] = {}
+
+
+@lru_cache(maxsize=1024)
+def timezone_code(timezone: Optional[str]) -> int:
+    """Small integer code of a timezone value."""
+    if not timezone:
+        return 0
+    with _CODES_LOCK:
+        return TIMEZONE_CODES.setdefault(timezone, len(TIMEZONE_CODES) + 1)
+
+
+def _availability_table() -> np.ndarray:
+    """Scores indexed by [requester kind, candidate kind, same timezone, same availability]."""
+    # Kinds are the codes capped at 2: not set, "any", anything else
+    table = np.zeros((3, 3, 2, 2))
+    table[2, 2, 0, 1] = 0.1
+    table[2, 2, 1, :] = 0.15
+    table[1, 1:] = 0.2
+    table[1:, 1] = 0.2
+    return table
+
+
+AVAILABILITY_SCORES = _availability_table()
+
+
+def compute_availability_score(requester: User, candidate: User) -> float:
+    """Availability match: same timezone or flexible availability (0-0.2)."""
+    requester_code = availability_code(requester.availability)
+    candidate_code = availability_code(candidate.availability)
+    same_timezone = bool(requester.timezone) and requester.timezone == candidate.timezone
+    return float(AVAILABILITY_SCORES[
+        min(requester_code, 2), min(candidate_code, 2), int(same_timezone), int(requester_code == candidate_code)
+    ])
+
+
+def availability_scores(requester: User, codes: np.ndarray, timezones: np.ndarray) -> np.ndarray:
+    """
+    compute_availability_score for every candidate with one table lookup, from
+    their availability and timezone code arrays (see CandidateColumns).
+    """
+    requester_code = availability_code(requester.availability)
+    requester_timezone = timezone_code(requester.timezone)
+    same_timezone = (timezones == requester_timezone) & (requester_timezone != 0)
+    return AVAILABILITY_SCORES[
+        min(requester_code, 2), np.minimum(codes, 2), same_timezone.astype(np.intp), (codes == requester_code).astype(np.intp)
+    ]
+
+
+def pad_words(bitsets: np.ndarray, words: int) -> np.ndarray:
+    """
+    Widen bitset rows to words. The vocabulary only grows, so rows packed
+    earlier just lack the newer bits, which are zero.
+    """
+    if bitsets.shape[1] >= words:
+        return bitsets
+    return np.pad(bitsets, ((0, 0), (0, words - bitsets.shape[1])))
+
+
+class CandidateColumns:
+    """
+    Structure-of-arrays store of everything scoring reads from a candidate:
+    skill bitset rows, availability codes, timezone codes and interest bitset
+    rows, one row per user id, plus an inverted index from lowercase skill
+    name to the ids of users having it. Users are read from the ORM once, when
+    first seen; the store is reset whenever any user or skill changes (see
+    all_profiles_version). All access goes through the lock, as suggestions
+    are refreshed in a worker thread.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.version: Optional[Tuple[int, int]] = None
+        self.reset()
+    
+    def reset(self):
+        self.rows: Dict[int, int] = {}
+        self.skill_users: Dict[str, Set[int]] = {}
+        self.bitsets = np.zeros((0, 1), dtype=np.uint64)
+        self.codes = np.zeros(0, dtype=np.intp)
+        self.timezones = np.zeros(0, dtype=np.intp)
+        self.interests = np.zeros((0, 1), dtype=np.uint64)
+    
+    def take(self, users: List[User]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(skill bitsets, availability codes, timezone codes, interest bitsets) of users, in order."""
+        with self.lock:
+            self._add(users)
+            rows = np.fromiter((self.rows[user.id] for user in users), dtype=np.intp, count=len(users))
+            return self.bitsets[rows], self.codes[rows], self.timezones[rows], self.interests[rows]
+    
+    def users_with_any(self, users: List[User], names: Iterable[str]) -> Set[int]:
+        """Ids of the users holding at least one of the skill names."""
+        with self.lock:
+            self._add(users)
+            return set().union(*(self.skill_users.get(name, ()) for name in names))
+    
+    def _add(self, users: List[User]):
+        """Reset the store if stale, then append the users not seen yet. Called with the lock held."""
+        version = all_profiles_version()
+        if version != self.version:
+            self.reset()
+            self.version = version
+        new = [user for user in users if user.id not in self.rows]
+        if new:
+            self._append(new)
+    
+    def _append(self, users: List[User]):
+        for user in users:
+            self.rows[user.id] = len(self.rows)
+            for name in skill_set(user):
+                self.skill_users.setdefault(name, set()).add(user.id)
+        bitsets = SKILL_INDEX.bitsets([skill_set(user) for user in users])
+        self.bitsets = np.vstack([pad_words(self.bitsets, bitsets.shape[1]), bitsets])
+        self.codes = np.concatenate([self.codes, [availability_code(user.availability) for user in users]]).astype(np.intp)
+        self.timezones = np.concatenate([self.timezones, [timezone_code(user.timezone) for user in users]]).astype(np.intp)
+        interests = build_interest_bitset(users)
+        self.interests = np.vstack([pad_words(self.interests, interests.shape[1]), interests])
+
+
+CANDIDATE_COLUMNS = CandidateColumns()
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, ties in input order.
+    
+    argpartition-style selection: only scores at or above the k-th best are
+    sorted, instead of the whole array.
+    """
+    if k <= 0:
+        return np.arange(0)
+    if k < len(scores):
+        threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+        selected = np.flatnonzero(scores >= threshold)
+    else:
+        selected = np.arange(len(scores))
+    return selected[np.argsort(-scores[selected], kind="stable")][:k]
+
+
+def _score_all_candidates(
+    requester_bits: np.ndarray,
+    needs_bits: np.ndarray,
+    candidate_bits: np.ndarray,
+    availability: np.ndarray,
+    needs_count: int
+) -> np.ndarray:
+    """
+    Match scores for every candidate bitset row, with the same formula and
+    operation order as _score(). The masked words and popcounts go through
+    one reused scratch buffer each and the score is accumulated in place,
+    instead of allocating a temporary per operation.
+    """
+    masked = np.empty_like(candidate_bits)
+    counts = np.empty(candidate_bits.shape, dtype=np.uint8)
+    
+    def popcount(mask: np.ndarray) -> np.ndarray:
+        np.bitwise_count(np.bitwise_and(candidate_bits, mask, out=masked), out=counts)
+        # Adding up word columns is much cheaper than a row-wise sum(axis=1)
+        total = counts[:, 0].astype(np.int32)
+        for word in range(1, counts.shape[1]):
+            total += counts[:, word]
+        return total
+    
+    covered, complementary, shared = (popcount(mask) for mask in (needs_bits, ~requester_bits, requester_bits))
+    
+    scores = covered / max(1, needs_count)
+    scores *= 0.5
+    for count, divisor, cap, weight in ((complementary, 10.0, 1.0, 0.3), (shared, 5.0, 0.3, 0.15)):
+        term = count / divisor
+        np.minimum(cap, term, out=term)
+        term *= weight
+        scores += term
+    scores += 0.05 * availability
+    return scores
+
+
+# One record per candidate from score_all()
+SCORES_DTYPE = np.dtype([("skill", np.float64), ("interest", np.float64), ("availability", np.float64)])
+
+
+def score_all(
+    context: Tuple[FrozenSet[str], FrozenSet[str]],
+    requester: User,
+    candidates: List[User]
+) -> np.ndarray:
+    """
+    Skill match score, interest similarity and availability score of every
+    candidate, from a single CandidateColumns lookup, as a SCORES_DTYPE array.
+    
+    Skill scores are rounded as find_best_matches ranks them; interest
+    similarities are not (see batch_interest_match).
+    """
+    requester_skills, needs_set = context
+    skill_bits, codes, timezones, interest_bits = CANDIDATE_COLUMNS.take(candidates)
+    # Packed after the candidates, so at least as wide as their rows. Needs come
+    # from the client and must not grow the vocabulary: every candidate skill
+    # was indexed by take(), so unknown needs are ones nobody covers, and
+    # len(needs_set) below still counts them
+    requester_bits, needs_bits = SKILL_INDEX.bitsets([requester_skills, SKILL_INDEX.known(needs_set)])
+    requester_interests = build_interest_bitset([requester])[0]
+    skill_bits = pad_words(skill_bits, len(requester_bits))
+    interest_bits = pad_words(interest_bits, len(requester_interests))
+    
+    scores = np.empty(len(candidates), dtype=SCORES_DTYPE)
+    scores["availability"] = availability_scores(requester, codes, timezones)
+    scores["skill"] = np.round(
+        _score_all_candidates(requester_bits, needs_bits, skill_bits, scores["availability"], len(needs_set)), 4
+    )
+    # Jaccard; either side without interests has an empty intersection and scores 0.0
+    intersection = np.bitwise_count(interest_bits & requester_interests).sum(axis=1, dtype=np.int64)
+    union = np.bitwise_count(interest_bits | requester_interests).sum(axis=1, dtype=np.int64)
+    scores["interest"] = intersection / np.maximum(union, 1)
+    return scores
 
 
 def find_best_matches(
@@ -82,27 +475,107 @@ def find_best_matches(
     all_users: List[User],
     required_skills: Optional[List[str]] = None,
     top_k: int = 10
-) -> List[Tuple[User, float, Dict[str, any]]]:
+) -> List[Tuple[User, float, MatchDetails]]:
     """
     Find the best complementary matches for a requester.
     
+    all_users are the candidates: active users other than the requester,
+    as filtered by the caller's query.
+    
     Returns:
         List of tuples: (candidate_user, match_score, match_details)
         Sorted by score descending.
     """
-    matches = []
+    candidates = all_users
+    if not candidates:
+        return []
+    
+    context = _prepare_context(requester, required_skills)
     
-    for candidate in all_users:
-        if candidate.id == requester.id or not candidate.is_active:
-            continue
-        
-        score, details = compute_complementary_match(requester, candidate, required_skills)
-        matches.append((candidate, score, details))
+    # Score only candidates having a needed skill first; if the k-th best of
+    # them beats anything a candidate without one can reach, the rest can't
+    # make the top k and are never scored
+    pool = CANDIDATE_COLUMNS.users_with_any(candidates, context[1])
+    if 0 < top_k <= len(pool):
+        overlapping = [c for c in candidates if c.id in pool]
+        scores = score_all(context, requester, overlapping)["skill"]
+        top = top_k_indices(scores, top_k)
+        if len(top) == top_k and scores[top[-1]] > ZERO_COVERAGE_MAX_SCORE:
+            return [(overlapping[i], *_score_with_details(context, requester, overlapping[i])) for i in top]
     
-    # Sort by score descending
-    matches.sort(key=lambda x: x[1], reverse=True)
+    top = top_k_indices(score_all(context, requester, candidates)["skill"], top_k)
     
-    return matches[:top_k]
+    return [(candidates[i], *_score_with_details(context, requester, candidates[i])) for i in top]
+
+
+def recompute_suggestions(db: Session, k: int = SUGGESTIONS_K) -> int:
+    """
+    Replace suggested_matches with every active user's top-k plain matches
+    (no required skills). The caller commits.
+    
+    Returns:
+        Number of rows written
+    """
+    users = db.query(User).filter(User.is_active == True).all()
+    rows = [
+        {"user_id": user.id, "rank": rank, "candidate_id": candidate.id, "score": score}
+        for user in users
+        for rank, (candidate, score, _) in enumerate(
+            find_best_matches(user, [other for other in users if other is not user], top_k=k), 1
+        )
+    ]
+    db.execute(delete(SuggestedMatch))
+    if rows:
+        db.execute(insert(SuggestedMatch), rows)
+    return len(rows)
+
+
+def suggestions_current() -> bool:
+    """Whether suggested_matches reflect the users as they are now."""
+    return suggestions_version == all_profiles_version()
+
+
+def refresh_suggestions() -> None:
+    """
+    Recompute suggested_matches unless they are still current. The version is
+    read before the users, so a change committed meanwhile leaves the new rows
+    marked stale rather than served.
+    """
+    global suggestions_version
+    version = all_profiles_version()
+    if version == suggestions_version:
+        return
+    with SessionLocal() as db:
+        recompute_suggestions(db)
+        db.commit()
+    suggestions_version = version
+
+
+def get_suggested_matches(
+    db: Session,
+    requester: User,
+    top_k: int = 10
+) -> Optional[List[Tuple[User, float, MatchDetails]]]:
+    """
+    Read the requester's plain matches from suggested_matches.
+    
+    Returns:
+        Same shape as find_best_matches(), or None when nothing current is
+        stored for the requester and the matches have to be computed live.
+    """
+    if top_k > SUGGESTIONS_K or not suggestions_current():
+        return None
+    candidates = (
+        db.query(User)
+        .join(SuggestedMatch, SuggestedMatch.candidate_id == User.id)
+        .filter(SuggestedMatch.user_id == requester.id, SuggestedMatch.rank <= top_k, User.is_active == True)
+        .order_by(SuggestedMatch.rank)
+        .all()
+    )
+    if not candidates:
+        return None
+    context = _prepare_context(requester)
+    return [(candidate, *_score_with_details(context, requester, candidate)) for candidate in candidates]
 
 
 def calculate_interest_match(
@@ -119,15 +592,15 @@ def calculate_interest_match(
         return 0.0
     
     # Normalize interests (remove # and lowercase for comparison)
-    interests1 = {i.lower().replace('#', '') for i in user1_interests if i}
-    interests2 = {i.lower().replace('#', '') for i in user2_interests if i}
+    interests1 = _normalized_interests(tuple(user1_interests))
+    interests2 = _normalized_interests(tuple(user2_interests))
     
     if not interests1 or not interests2:
         return 0.0
     
     # Calculate Jaccard similarity (intersection over union)
-    intersection = len(interests1.intersection(interests2))
-    union = len(interests1.union(interests2))
+    intersection = len(interests1 & interests2)
+    union = len(interests1 | interests2)
     
     if union == 0:
         return 0.0
@@ -136,6 +609,31 @@ def calculate_interest_match(
     return round(similarity, 4)
 
 
+def interest_list(user: User) -> List[str]:
+    """Parse a user's interests from the database (could be JSON string or already parsed)."""
+    if not user.interests:
+        return []
+    if isinstance(user.interests, str):
+        try:
+            return orjson.loads(user.interests)
+        except (orjson.JSONDecodeError, TypeError):
+            return []
+    return user.interests
+
+
+@lru_cache(maxsize=4096)
+def _normalized_interests(interests: Tuple[str, ...]) -> FrozenSet[str]:
+    return frozenset(sys.intern(i.lower().replace('#', '')) for i in interests if i)
+
+
+def interest_set(user: User) -> FrozenSet[str]:
+    """
+    Normalized interests (without # and lowercased), as calculate_interest_match
+    compares them. Cached on the interests themselves, like skill_set().
+    """
+    return _normalized_interests(tuple(interest_list(user)))
+
+
 def get_interest_match_for_user(
     current_user: User,
     candidate: User
@@ -144,27 +642,21 @@ def get_interest_match_for_user(
     Get interest match percentage between current user and candidate.
     Handles JSON string parsing from database.
     """
-    # Parse interests from database (could be JSON string or already parsed)
-    current_interests = []
-    candidate_interests = []
-    
-    if current_user.interests:
-        if isinstance(current_user.interests, str):
-            try:
-                current_interests = json.loads(current_user.interests)
-            except (json.JSONDecodeError, TypeError):
-                current_interests = []
-        else:
-            current_interests = current_user.interests
-    
-    if candidate.interests:
-        if isinstance(candidate.interests, str):
-            try:
-                candidate_interests = json.loads(candidate.interests)
-            except (json.JSONDecodeError, TypeError):
-                candidate_interests = []
-        else:
-            candidate_interests = candidate.interests
-    
-    return calculate_interest_match(current_interests, candidate_interests)
+    return calculate_interest_match(interest_list(current_user), interest_list(candidate))
+
+
+def build_interest_bitset(users: List[User]) -> np.ndarray:
+    """Pack the normalized interests of users into INTEREST_INDEX bitset rows."""
+    return INTEREST_INDEX.bitsets([interest_set(user) for user in users])
+
+
+def batch_interest_match(current_user: User, candidates: List[User]) -> np.ndarray:
+    """
+    Jaccard interest similarity between current_user and every candidate in
+    one pass over the interest bitsets, matching calculate_interest_match.
+    
+    The similarities are not rounded; callers round with round(x, 4) so the
+    reported values stay identical to calculate_interest_match.
+    """
+    return score_all(_prepare_context(current_user), current_user, candidates)["interest"]
 
@@ -1,16 +1,27 @@
 """
 Pydantic models for API request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
-from typing import List, Optional, Dict, Any, Union
+from pydantic import AfterValidator, BaseModel, Field, field_validator, model_validator
+from typing import Annotated, List, Literal, Optional, Dict, Any, Union
 from datetime import datetime
-import json
+import orjson
+import re
+
+
+_EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+def _fast_email(value: str) -> str:
+    """Check the basic shape of an email address with one precompiled regex."""
+    if not _EMAIL_RE.fullmatch(value):
+        raise ValueError("value is not a valid email address")
+    return value
 
 
 # User Models
 class UserCreate(BaseModel):
     """Model for creating a new user."""
-    email: EmailStr
+    email: Annotated[str, AfterValidator(_fast_email)]
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=6)
     full_name: str = Field(..., min_length=1, max_length=100)
@@ -78,21 +89,42 @@ class UserResponse(BaseModel):
     @classmethod
     def parse_json_string(cls, v: Union[str, List[str], None]) -> Optional[List[str]]:
         """Parse JSON string to list if needed."""
-        if v is None:
-            return None
         if isinstance(v, list):
             return v
-        if isinstance(v, str):
-            if not v.strip():
-                return None
-            try:
-                parsed = json.loads(v)
-                if isinstance(parsed, list):
-                    return parsed
-                return None
-            except (json.JSONDecodeError, TypeError):
-                return None
-        return None
+        if not isinstance(v, str):
+            return None
+        # Blank strings fail to parse as well, no need to strip() first
+        try:
+            parsed = orjson.loads(v)
+        except orjson.JSONDecodeError:
+            return None
+        return parsed if isinstance(parsed, list) else None
+    
+    @classmethod
+    def from_orm_fast(cls, user: Any, interest_match: Optional[float] = None) -> "UserResponse":
+        """
+        Build a response from a User row read from the database, skipping
+        validation. Inbound payloads still go through the validating models.
+        """
+        return cls.model_construct(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            bio=user.bio,
+            profile_picture=user.profile_picture,
+            interests=cls.parse_json_string(user.interests) or [],
+            looking_for=cls.parse_json_string(user.looking_for) or [],
+            location=user.location,
+            timezone=user.timezone,
+            availability=user.availability,
+            linkedin_url=user.linkedin_url,
+            github_url=user.github_url,
+            profile_type=user.profile_type,
+            skills=[SkillResponse.model_construct(id=s.id, name=s.name, category=s.category) for s in user.skills],
+            interest_match=interest_match,
+            created_at=user.created_at
+        )
 
 
 # Project Models
@@ -220,7 +252,7 @@ class PostCreate(BaseModel):
     content: Optional[str] = None
     image: Optional[str] = None  # Base64 image or URL
     slot_count: int = Field(..., ge=1, le=5)  # Number of slots (1-5)
-    post_type: Optional[str] = Field(default="regular", description="Type of post: 'regular' or 'help'")
+    post_type: Optional[Literal["regular", "help"]] = Field(default="regular", description="Type of post: 'regular' or 'help'")
 
 
 class PostSlotResponse(BaseModel):
@@ -245,7 +277,8 @@ class PostResponse(BaseModel):
     slots: List[PostSlotResponse] = []
     post_type: Optional[str] = "regular"
     help_request_count: Optional[int] = 0
-    comments: List["CommentResponse"] = []
+    comment_count: int = 0
+    comments: List["CommentResponse"] = []  # Not filled by the feed; use GET /api/posts/{id}/comments
     created_at: datetime
     
     model_config = {"from_attributes": True}
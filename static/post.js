@@ -509,27 +509,12 @@ async function loadPosts() {
                         ${postType === 'regular' ? `
                             <div class="post-comments-section">
                                 <div class="comments-header">
-                                    <h4>Comments (${post.comments ? post.comments.length : 0})</h4>
+                                    <h4 data-comment-count="${post.comment_count || 0}">Comments (${post.comment_count || 0})</h4>
                                 </div>
                                 <div class="comments-list" id="comments-${post.id}">
-                                    ${post.comments && post.comments.length > 0 ? post.comments.map(comment => {
-                                        const commentAuthor = comment.author || {};
-                                        const commentInitials = commentAuthor.full_name ? commentAuthor.full_name.split(' ').map(n => n[0]).join('').toUpperCase().slice(0, 2) : '?';
-                                        const commentAvatar = commentAuthor.profile_picture || `data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E`;
-                                        const commentTimeAgo = getTimeAgo(new Date(comment.created_at));
-                                        return `
-                                            <div class="comment-item">
-                                                <img src="${commentAvatar}" alt="${commentAuthor.full_name || 'User'}" class="comment-avatar" onerror="this.src='data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E'">
-                                                <div class="comment-content">
-                                                    <div class="comment-header">
-                                                        <strong>${commentAuthor.full_name || commentAuthor.username || 'Unknown User'}</strong>
-                                                        <span class="comment-time">${commentTimeAgo}</span>
-                                                    </div>
-                                                    <div class="comment-text">${escapeHtml(comment.content)}</div>
-                                                </div>
-                                            </div>
-                                        `;
-                                    }).join('') : '<p class="no-comments">No comments yet. Be the first to comment!</p>'}
+                                    ${post.comment_count > 0
+                                        ? `<button class="btn-secondary show-comments-btn" data-post-id="${post.id}" type="button">Show comments</button>`
+                                        : '<p class="no-comments">No comments yet. Be the first to comment!</p>'}
                                 </div>
                                 <div class="comment-form">
                                     <textarea class="comment-input" id="comment-input-${post.id}" placeholder="Write a comment..." rows="2"></textarea>
@@ -601,6 +586,16 @@ function attachPostMenuListeners() {
         });
     });
 
+    // Show comments button handlers (comments are not included in the feed)
+    const showCommentsButtons = document.querySelectorAll('.show-comments-btn');
+    showCommentsButtons.forEach(btn => {
+        btn.addEventListener('click', async (e) => {
+            e.stopPropagation();
+            const postId = btn.getAttribute('data-post-id');
+            await loadComments(postId, btn);
+        });
+    });
+
     // Comment submit button handlers
     const commentSubmitButtons = document.querySelectorAll('.comment-submit-btn');
     commentSubmitButtons.forEach(btn => {
@@ -922,31 +917,18 @@ async function handleCommentSubmit(postId, buttonElement) {
                 }
 
                 // Create comment HTML
-                const commentAuthor = newComment.author || {};
-                const commentInitials = commentAuthor.full_name ? commentAuthor.full_name.split(' ').map(n => n[0]).join('').toUpperCase().slice(0, 2) : '?';
-                const commentAvatar = commentAuthor.profile_picture || `data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E`;
-                const commentTimeAgo = getTimeAgo(new Date(newComment.created_at));
-                
-                const commentHtml = `
-                    <div class="comment-item">
-                        <img src="${commentAvatar}" alt="${commentAuthor.full_name || 'User'}" class="comment-avatar" onerror="this.src='data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E'">
-                        <div class="comment-content">
-                            <div class="comment-header">
-                                <strong>${commentAuthor.full_name || commentAuthor.username || 'Unknown User'}</strong>
-                                <span class="comment-time">${commentTimeAgo}</span>
-                            </div>
-                            <div class="comment-text">${escapeHtml(newComment.content)}</div>
-                        </div>
-                    </div>
-                `;
+                const commentHtml = renderComment(newComment);
                 
                 commentsList.insertAdjacentHTML('beforeend', commentHtml);
 
-                // Update comment count in header
+                // Update comment count in header; count from the post's comment_count,
+                // as collapsed comments are not in the list
                 const commentsHeader = commentsList.previousElementSibling;
-                if (commentsHeader && commentsHeader.querySelector('h4')) {
-                    const currentCount = commentsList.querySelectorAll('.comment-item').length;
-                    commentsHeader.querySelector('h4').textContent = `Comments (${currentCount})`;
+                const countHeading = commentsHeader && commentsHeader.querySelector('h4');
+                if (countHeading) {
+                    const currentCount = (parseInt(countHeading.dataset.commentCount, 10) || 0) + 1;
+                    countHeading.dataset.commentCount = currentCount;
+                    countHeading.textContent = `Comments (${currentCount})`;
                 }
             }
 
@@ -965,6 +947,55 @@ async function handleCommentSubmit(postId, buttonElement) {
     }
 }
 
+// Load the comments of a post on demand
+async function loadComments(postId, buttonElement) {
+    const commentsList = document.getElementById(`comments-${postId}`);
+    if (!commentsList) return;
+
+    buttonElement.disabled = true;
+    buttonElement.textContent = 'Loading...';
+
+    try {
+        const response = await fetch(`${API_BASE}/posts/${postId}/comments`);
+        if (response.ok) {
+            const comments = await safeJsonParse(response);
+            commentsList.innerHTML = comments.length > 0
+                ? comments.map(renderComment).join('')
+                : '<p class="no-comments">No comments yet. Be the first to comment!</p>';
+        } else {
+            const error = await safeJsonParse(response);
+            alert(error.detail || 'Failed to load comments');
+            buttonElement.disabled = false;
+            buttonElement.textContent = 'Show comments';
+        }
+    } catch (error) {
+        alert(`Error: ${error.message}`);
+        buttonElement.disabled = false;
+        buttonElement.textContent = 'Show comments';
+    }
+}
+
+// Helper function to render a single comment
+function renderComment(comment) {
+    const commentAuthor = comment.author || {};
+    const commentInitials = commentAuthor.full_name ? commentAuthor.full_name.split(' ').map(n => n[0]).join('').toUpperCase().slice(0, 2) : '?';
+    const commentAvatar = commentAuthor.profile_picture || `data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E`;
+    const commentTimeAgo = getTimeAgo(new Date(comment.created_at));
+    
+    return `
+        <div class="comment-item">
+            <img src="${commentAvatar}" alt="${commentAuthor.full_name || 'User'}" class="comment-avatar" onerror="this.src='data:image/svg+xml,%3Csvg xmlns=%22http://www.w3.org/2000/svg%22 width=%2240%22 height=%2240%22%3E%3Ccircle cx=%2220%22 cy=%2220%22 r=%2218%22 fill=%22%231dbf73%22/%3E%3Ctext x=%2220%22 y=%2225%22 font-size=%2214%22 fill=%22white%22 text-anchor=%22middle%22%3E${commentInitials}%3C/text%3E%3C/svg%3E'">
+            <div class="comment-content">
+                <div class="comment-header">
+                    <strong>${commentAuthor.full_name || commentAuthor.username || 'Unknown User'}</strong>
+                    <span class="comment-time">${commentTimeAgo}</span>
+                </div>
+                <div class="comment-text">${escapeHtml(comment.content)}</div>
+            </div>
+        </div>
+    `;
+}
+
 // Helper function to get time ago
 function getTimeAgo(date) {
     const seconds = Math.floor((new Date() - date) / 1000);